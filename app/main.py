@@ -30,39 +30,14 @@ def main() -> None:
         config["profiles_encrypted"] = True
         storage.save_config(config)
 
-    passphrase: str | None = None
-    while True:
-        try:
-            current_profile, profiles = storage.load_profiles(passphrase=passphrase)
-            break
-        except storage.ProfilesEncryptionError as exc:
-            prompt = "Enter your profiles passphrase:"
-            if passphrase:
-                prompt = "Passphrase incorrect. Try again:"
-            passphrase_text, ok = QtWidgets.QInputDialog.getText(
-                None,
-                "Profiles Locked",
-                prompt,
-                QtWidgets.QLineEdit.Password,
-            )
-            if not ok:
-                return
-            passphrase = passphrase_text.strip()
-            if not passphrase:
-                QtWidgets.QMessageBox.warning(None, "Profiles Locked", str(exc))
-                passphrase = None
-
-    hotkeys = profiles.get(current_profile, {})
-
     engine = TriggerEngine(
-        hotkeys=hotkeys,
         cooldown=float(config.get("cooldown", 0.3)),
         paste_delay=float(config.get("paste_delay", 0.05)),
     )
 
+    # The window loads (and, if needed, unlocks) the profiles on a worker thread.
     window = MainWindow(
         engine,
-        profile_passphrase=passphrase,
         profiles_encrypted=bool(config.get("profiles_encrypted", False)),
     )
     window.show()
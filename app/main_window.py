@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import base64
+import contextlib
 import json
+import queue
+import re
 import secrets
 import sys
 import threading
@@ -10,6 +13,7 @@ import time
 import typing
 import urllib.error
 import urllib.request
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Dict
 
@@ -23,6 +27,7 @@ from backend import autostart
 from backend import storage
 from backend.logging_utils import configure_logging, get_logger
 from backend.trigger_engine import TriggerEngine
+from backend.trigger_trie import TriggerTrie
 from openkeyflow.metadata import project_name, project_version
 
 APP_NAME = project_name()
@@ -33,6 +38,41 @@ DEFAULT_HOTKEY_MODIFIER = "ctrl"
 DEFAULT_QUICK_ADD_KEY = "f10"
 DEFAULT_PROFILE_SWITCH_KEY = "f11"
 DEFAULT_TOGGLE_HOTKEY_KEY = "f12"
+DEFAULT_ACCENT_COLOR = "#f1c40f"
+PROFILE_COLOR_PALETTE = (
+    ("Ruby", "#e74c3c"),
+    ("Coral", "#ff6b6b"),
+    ("Amber", "#f39c12"),
+    ("Lime", "#8bc34a"),
+    ("Teal", "#1abc9c"),
+    ("Sky", "#3498db"),
+    ("Indigo", "#5c6bc0"),
+    ("Violet", "#9b59b6"),
+    ("Slate", "#7f8c8d"),
+)
+CUSTOM_COLOR_DEFAULT = QtGui.QColor("#ff6b6b")
+LINE_NUMBER_CACHE_SIZE = 4096
+AUTOSTART_STATUS_TTL = 2.0
+SEARCH_COMPLETION_LIMIT = 50
+PROFILE_COLOR_ROLE = QtCore.Qt.UserRole + 1
+HEX_COLOR_PATTERN = re.compile(r"#[0-9a-fA-F]{6}")
+PROFILE_BUTTON_STYLESHEET = (
+    "QPushButton {{"
+    "background-color: {base};"
+    "color: {text};"
+    "border: 1px solid {pressed};"
+    "border-radius: 4px;"
+    "padding: 4px 8px;"
+    "}}"
+    "QPushButton:hover {{"
+    "background-color: {hover};"
+    "color: {text};"
+    "}}"
+    "QPushButton:pressed {{"
+    "background-color: {pressed};"
+    "color: {text};"
+    "}}"
+)
 HOTKEY_CONFLICTS = {
     "windows": {
         "alt+f4",
@@ -80,6 +120,24 @@ def split_hotkey(hotkey: str) -> tuple[str, str]:
     key = next((part for part in reversed(parts) if part not in HOTKEY_MODIFIERS), "")
     return modifier, key
 
+_STATIC_NUMBERS: "OrderedDict[tuple[str, int], tuple[QtGui.QStaticText, float]]" = OrderedDict()
+
+
+def _static_line_number(number: int, font: QtGui.QFont, font_key: str) -> tuple[QtGui.QStaticText, float]:
+    key = (font_key, number)
+    cached = _STATIC_NUMBERS.get(key)
+    if cached is not None:
+        _STATIC_NUMBERS.move_to_end(key)
+        return cached
+    static = QtGui.QStaticText(str(number))
+    static.setTextFormat(QtCore.Qt.PlainText)
+    static.setTextOption(QtGui.QTextOption(QtCore.Qt.AlignRight))
+    static.prepare(QtGui.QTransform(), font)
+    cached = _STATIC_NUMBERS[key] = (static, static.size().width())
+    if len(_STATIC_NUMBERS) > LINE_NUMBER_CACHE_SIZE:
+        _STATIC_NUMBERS.popitem(last=False)
+    return cached
+
 class LineNumberArea(QtWidgets.QWidget):
     def __init__(self, editor: "CodeEditor") -> None:
         super().__init__(editor)
@@ -92,30 +150,50 @@ class LineNumberArea(QtWidgets.QWidget):
         self.editor.lineNumberAreaPaintEvent(event)
 
 class CodeEditor(QtWidgets.QPlainTextEdit):
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+    def __init__(self, parent: QtWidgets.QWidget | None = None, *, font: QtGui.QFont | None = None) -> None:
         super().__init__(parent)
+        self._line_number_area: LineNumberArea | None = None
+        self._gutter_colors: tuple[QtGui.QColor, QtGui.QColor] | None = None
+        if font is not None:
+            # Applied before the gutter exists so its width is measured once.
+            self.setFont(font)
         self._line_number_area = LineNumberArea(self)
+        self._last_lna_width = -1
+        self._digit_w = self.fontMetrics().horizontalAdvance("9")
+        self._width_digits = 0
+        self._width_for_digits = 0
         self.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
         self.blockCountChanged.connect(self.update_line_number_area_width)
         self.updateRequest.connect(self.update_line_number_area)
         self.cursorPositionChanged.connect(self.highlight_current_line)
         self.update_line_number_area_width(0)
+        self._hl_sel = QtWidgets.QTextEdit.ExtraSelection()
+        self._rebuild_highlight_format()
         self.highlight_current_line()
 
     def lineNumberAreaWidth(self) -> int:  # noqa: N802 - Qt override
         digits = len(str(max(1, self.blockCount())))
-        padding = 12 + self.fontMetrics().horizontalAdvance("9") * digits
-        return padding
+        if digits != self._width_digits:
+            self._width_digits = digits
+            self._width_for_digits = 12 + self._digit_w * digits
+        return self._width_for_digits
 
     def update_line_number_area_width(self, _: int) -> None:
-        self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
+        width = self.lineNumberAreaWidth()
+        if width == self._last_lna_width:
+            return
+        self._last_lna_width = width
+        self.setViewportMargins(width, 0, 0, 0)
 
     def update_line_number_area(self, rect: QtCore.QRect, dy: int) -> None:
+        viewport_rect = self.viewport().rect()
         if dy:
             self._line_number_area.scroll(0, dy)
         else:
-            self._line_number_area.update(0, rect.y(), self._line_number_area.width(), rect.height())
-        if rect.contains(self.viewport().rect()):
+            dirty = rect.intersected(viewport_rect)
+            if dirty.isValid():
+                self._line_number_area.update(0, dirty.y(), self._line_number_area.width(), dirty.height())
+        if rect.contains(viewport_rect):
             self.update_line_number_area_width(0)
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # noqa: N802 - Qt override
@@ -127,44 +205,64 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
 
     def lineNumberAreaPaintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802 - Qt override
         painter = QtGui.QPainter(self._line_number_area)
-        palette = self.palette()
-        background = palette.color(QtGui.QPalette.AlternateBase)
+        if self._gutter_colors is None:
+            palette = self.palette()
+            number_color = QtGui.QColor(palette.color(QtGui.QPalette.Text))
+            number_color.setAlpha(160)
+            self._gutter_colors = (palette.color(QtGui.QPalette.AlternateBase), number_color)
+        background, number_color = self._gutter_colors
         painter.fillRect(event.rect(), background)
 
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-        bottom = top + int(self.blockBoundingRect(block).height())
+        # NoWrap keeps every block a single line tall, so the height is read once.
+        block_height = int(self.blockBoundingRect(block).height()) or self.fontMetrics().height()
+        bottom = top + block_height
 
-        number_color = QtGui.QColor(palette.color(QtGui.QPalette.Text))
-        number_color.setAlpha(160)
         painter.setPen(number_color)
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.drawText(
-                    0,
-                    top,
-                    self._line_number_area.width() - 4,
-                    self.fontMetrics().height(),
-                    QtCore.Qt.AlignRight,
-                    number,
-                )
+        font = self.font()
+        painter.setFont(font)
+        font_key = font.key()
+        ev_top = event.rect().top()
+        ev_bot = event.rect().bottom()
+        area_w = self._line_number_area.width() - 4
+
+        while block.isValid():
+            if top > ev_bot:
+                break
+            if bottom >= ev_top and block.isVisible():
+                static, text_w = _static_line_number(block_number + 1, font, font_key)
+                painter.drawStaticText(QtCore.QPointF(area_w - text_w, top), static)
             block = block.next()
             top = bottom
-            bottom = top + int(self.blockBoundingRect(block).height())
+            bottom = top + block_height
             block_number += 1
 
+    def _rebuild_highlight_format(self) -> None:
+        self._hl_color = QtGui.QColor(self.palette().color(QtGui.QPalette.Highlight))
+        self._hl_color.setAlpha(40)
+        self._hl_format = QtGui.QTextCharFormat()
+        self._hl_format.setBackground(self._hl_color)
+        self._hl_format.setProperty(QtGui.QTextFormat.FullWidthSelection, True)
+        self._hl_sel.format = self._hl_format
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:  # noqa: N802 - Qt override
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.PaletteChange:
+            self._gutter_colors = None
+            self._rebuild_highlight_format()
+            self.highlight_current_line()
+        elif event.type() == QtCore.QEvent.FontChange and self._line_number_area is not None:
+            self._digit_w = self.fontMetrics().horizontalAdvance("9")
+            self._width_digits = 0
+            self.update_line_number_area_width(0)
+
     def highlight_current_line(self) -> None:
-        selection = QtWidgets.QTextEdit.ExtraSelection()
-        line_color = QtGui.QColor(self.palette().color(QtGui.QPalette.Highlight))
-        line_color.setAlpha(40)
-        selection.format.setBackground(line_color)
-        selection.format.setProperty(QtGui.QTextFormat.FullWidthSelection, True)
-        selection.cursor = self.textCursor()
-        selection.cursor.clearSelection()
-        self.setExtraSelections([selection])
+        cursor = self.textCursor()
+        cursor.clearSelection()
+        self._hl_sel.cursor = cursor
+        self.setExtraSelections([self._hl_sel])
 
 class ProfileSwitchToast(QtWidgets.QWidget):
     def __init__(self, message: str, color: QtGui.QColor) -> None:
@@ -355,12 +453,133 @@ class UpdateCheckWorker(QtCore.QObject):
         message = f"You're up to date (v{APP_VERSION})." if up_to_date else f"Update available: v{latest}."
         self.finished.emit(message, up_to_date)
         
+class ProfileLoadWorker(QtCore.QObject):
+    finished = QtCore.pyqtSignal(str, object)
+    locked = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, passphrase: str | None) -> None:
+        super().__init__()
+        self.passphrase = passphrase
+
+    def run(self) -> None:
+        try:
+            current_profile, profiles = storage.load_profiles(passphrase=self.passphrase)
+        except storage.ProfilesEncryptionError as exc:
+            self.locked.emit(str(exc))
+            return
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit(current_profile, profiles)
+
+class ProfileWriter(QtCore.QThread):
+    """Serialize profile snapshots to disk off the GUI thread, newest first."""
+
+    written = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._queue: queue.Queue = queue.Queue()
+
+    def submit(self, current_profile: str, profiles: Dict[str, Dict[str, str]], passphrase: str | None) -> None:
+        item = (current_profile, profiles, passphrase)
+        if not self.isRunning():
+            # Stopped (or never started): write on the caller rather than queueing into the void.
+            self._write(item)
+            return
+        self._queue.put(item)
+
+    def wait_idle(self) -> None:
+        """Block until every submitted snapshot has been written."""
+        if self.isRunning():
+            self._queue.join()
+
+    def stop(self) -> None:
+        if not self.isRunning():
+            return
+        self._queue.put(None)
+        self.wait()
+
+    def run(self) -> None:
+        stopping = False
+        while not stopping:
+            latest = None
+            done = 0
+            # Only the newest snapshot matters; skip anything queued behind it.
+            while done == 0 or not self._queue.empty():
+                item = self._queue.get()
+                done += 1
+                if item is None:
+                    stopping = True
+                else:
+                    latest = item
+            try:
+                if latest is not None:
+                    self._write(latest)
+            finally:
+                for _ in range(done):
+                    self._queue.task_done()
+
+    def _write(self, item: tuple[str, Dict[str, Dict[str, str]], str | None]) -> None:
+        current_profile, profiles, passphrase = item
+        try:
+            storage.save_profiles(current_profile, profiles, passphrase=passphrase)
+        except Exception as exc:
+            self.failed.emit(str(exc))
+        else:
+            self.written.emit()
+
+class EngineUpdateTask(QtCore.QRunnable):
+    """Push hotkey snapshots to the engine, coalescing bursts into one rebuild."""
+
+    def __init__(self, engine: TriggerEngine) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._pending: Dict[str, str] | None = None
+        self._queued = False
+
+    def submit(self, hotkeys: Dict[str, str]) -> bool:
+        """Store the latest snapshot; return True when the task must be started."""
+        with self._lock:
+            self._pending = hotkeys
+            if self._queued:
+                return False
+            self._queued = True
+            return True
+
+    def run(self) -> None:
+        while True:
+            with self._lock:
+                hotkeys = self._pending
+                self._pending = None
+                if hotkeys is None:
+                    self._queued = False
+                    return
+            self._engine.update_hotkeys(hotkeys)
+
+_AUTOSTART_STATUS: tuple[float, tuple[bool, str | None]] | None = None
+
+def autostart_status() -> tuple[bool, str | None]:
+    global _AUTOSTART_STATUS
+    now = time.monotonic()
+    if _AUTOSTART_STATUS is None or now - _AUTOSTART_STATUS[0] >= AUTOSTART_STATUS_TTL:
+        _AUTOSTART_STATUS = (now, autostart.status())
+    return _AUTOSTART_STATUS[1]
+
+def _invalidate_autostart_status() -> None:
+    global _AUTOSTART_STATUS
+    _AUTOSTART_STATUS = None
+
 def autostart_supported() -> bool:
-    _, error = autostart.status()
+    _, error = autostart_status()
     return error is None
 
 def is_autostart_enabled() -> bool:
-    enabled, error = autostart.status()
+    enabled, error = autostart_status()
     if error:
         return False
     return enabled
@@ -370,6 +589,7 @@ def set_autostart_enabled(parent: QtWidgets.QWidget, enabled: bool) -> bool:
         success, message = autostart.enable()
     else:
         success, message = autostart.disable()
+    _invalidate_autostart_status()
     if not success:
         QtWidgets.QMessageBox.warning(
             parent,
@@ -378,26 +598,167 @@ def set_autostart_enabled(parent: QtWidgets.QWidget, enabled: bool) -> bool:
         )
     return success
 
+class HotkeyTableModel(QtCore.QAbstractTableModel):
+    HEADERS = ("Hotkey", "Output")
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._triggers: list[str] = []
+        self._outputs: list[str] = []
+        self._triggers_lc: list[str] = []
+        self._outputs_lc: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802 - Qt override
+        return 0 if parent.isValid() else len(self._triggers)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802 - Qt override
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> typing.Any:
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._outputs[index.row()] if index.column() else self._triggers[index.row()]
+        if role == QtCore.Qt.UserRole:
+            return self._triggers[index.row()]
+        return None
+
+    def headerData(  # noqa: N802 - Qt override
+        self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole
+    ) -> typing.Any:
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def row_at(self, row: int) -> tuple[str, str]:
+        return self._triggers[row], self._outputs[row]
+
+    def folded_columns(self) -> tuple[list[str], list[str]]:
+        """Casefolded trigger and output columns aligned with the model rows."""
+        return self._triggers_lc, self._outputs_lc
+
+    def reset(self, mapping: Dict[str, str]) -> None:
+        self.beginResetModel()
+        self._triggers = list(mapping)
+        self._outputs = list(mapping.values())
+        self._triggers_lc = [trigger.casefold() for trigger in self._triggers]
+        self._outputs_lc = [output.casefold() for output in self._outputs]
+        self._index = {trigger: row for row, trigger in enumerate(self._triggers)}
+        self.endResetModel()
+
+    def add(self, trigger: str, output: str) -> None:
+        self.upsert([(trigger, output)])
+
+    def upsert(self, rows: typing.Iterable[tuple[str, str]]) -> None:
+        appended: dict[str, str] = {}
+        changed: list[int] = []
+        for trigger, output in rows:
+            row = self._index.get(trigger)
+            if row is None:
+                appended[trigger] = output
+            elif self._outputs[row] != output:
+                self._outputs[row] = output
+                self._outputs_lc[row] = output.casefold()
+                changed.append(row)
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), 1), self.index(max(changed), 1))
+        if not appended:
+            return
+        first = len(self._triggers)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(appended) - 1)
+        self._triggers.extend(appended)
+        self._outputs.extend(appended.values())
+        self._triggers_lc.extend(trigger.casefold() for trigger in appended)
+        self._outputs_lc.extend(output.casefold() for output in appended.values())
+        for offset, trigger in enumerate(appended):
+            self._index[trigger] = first + offset
+        self.endInsertRows()
+
+    def remove(self, triggers: typing.Iterable[str]) -> None:
+        rows = sorted(
+            (self._index.pop(trigger) for trigger in set(triggers) if trigger in self._index),
+            reverse=True,
+        )
+        if not rows:
+            return
+        columns = (self._triggers, self._outputs, self._triggers_lc, self._outputs_lc)
+        start = end = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            self.beginRemoveRows(QtCore.QModelIndex(), start, end)
+            for column in columns:
+                del column[start : end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                start = end = row
+        for row in range(rows[-1], len(self._triggers)):
+            self._index[self._triggers[row]] = row
+
 class HotkeyFilter(QtCore.QSortFilterProxyModel):
     def __init__(self) -> None:
         super().__init__()
         self.query = ""
+        self._mask: bytearray | None = None
+
+    def setSourceModel(self, model: HotkeyTableModel) -> None:  # noqa: N802 - Qt override
+        previous = self.sourceModel()
+        if previous is not None:
+            for signal in self._row_cache_signals(previous):
+                signal.disconnect(self._invalidate_row_cache)
+        # Connected ahead of the proxy's own handlers so re-filtering never sees stale rows.
+        if model is not None:
+            for signal in self._row_cache_signals(model):
+                signal.connect(self._invalidate_row_cache)
+        self._mask = None
+        super().setSourceModel(model)
+
+    @staticmethod
+    def _row_cache_signals(model: QtCore.QAbstractItemModel) -> tuple:
+        return (
+            model.dataChanged,
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.modelReset,
+            model.layoutChanged,
+        )
+
+    def _invalidate_row_cache(self, *_: object) -> None:
+        self._mask = None
 
     def setQuery(self, text: str) -> None:  # noqa: N802 (Qt naming)
-        self.query = text.lower()
+        query = text.casefold()
+        if query == self.query:
+            return
+        self.query = query
+        self._mask = None
         self.invalidateFilter()
 
+    def _accepted_rows(self) -> bytearray:
+        if self._mask is None:
+            query = self.query
+            triggers, outputs = self.sourceModel().folded_columns()
+            self._mask = bytearray(
+                query in trigger or query in output for trigger, output in zip(triggers, outputs)
+            )
+        return self._mask
+
     def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
         if not self.query:
             return True
-        model = self.sourceModel()
-        key_idx = model.index(source_row, 0, source_parent)
-        val_idx = model.index(source_row, 1, source_parent)
-        trigger = (model.data(key_idx, QtCore.Qt.DisplayRole) or "").lower()
-        output = (model.data(val_idx, QtCore.Qt.DisplayRole) or "").lower()
-        return self.query in trigger or self.query in output
+        return bool(self._accepted_rows()[source_row])
+
+_STATUS_ICONS: dict[tuple[bool, int], QtGui.QIcon] = {}
+_COLOR_ICONS: dict[tuple[int, int], QtGui.QIcon] = {}
 
 def make_status_icon(enabled: bool, *, override_color: QtGui.QColor | None = None) -> QtGui.QIcon:
+    key = (enabled, override_color.rgba() if override_color is not None else -1)
+    cached = _STATUS_ICONS.get(key)
+    if cached is not None:
+        return cached
     icon_size = 64
     pixmap = QtGui.QPixmap(icon_size, icon_size)
     pixmap.fill(QtCore.Qt.transparent)
@@ -410,9 +771,14 @@ def make_status_icon(enabled: bool, *, override_color: QtGui.QColor | None = Non
     diameter = icon_size - (margin * 2)
     painter.drawEllipse(margin, margin, diameter, diameter)
     painter.end()
-    return QtGui.QIcon(pixmap)
+    icon = _STATUS_ICONS[key] = QtGui.QIcon(pixmap)
+    return icon
 
 def make_color_icon(color: QtGui.QColor, size: int = 12) -> QtGui.QIcon:
+    key = (color.rgba(), size)
+    cached = _COLOR_ICONS.get(key)
+    if cached is not None:
+        return cached
     pixmap = QtGui.QPixmap(size, size)
     pixmap.fill(QtCore.Qt.transparent)
     painter = QtGui.QPainter(pixmap)
@@ -421,11 +787,21 @@ def make_color_icon(color: QtGui.QColor, size: int = 12) -> QtGui.QIcon:
     painter.setPen(QtGui.QPen(QtGui.QColor(20, 20, 20, 120), 1))
     painter.drawRoundedRect(0, 0, size - 1, size - 1, 3, 3)
     painter.end()
-    return QtGui.QIcon(pixmap)
+    icon = _COLOR_ICONS[key] = QtGui.QIcon(pixmap)
+    return icon
+
+_READABLE_CACHE: dict[int, QtGui.QColor] = {}
 
 def readable_text_color(color: QtGui.QColor) -> QtGui.QColor:
+    key = color.rgb()
+    cached = _READABLE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if len(_READABLE_CACHE) > 1024:
+        _READABLE_CACHE.clear()
     luminance = (0.299 * color.red()) + (0.587 * color.green()) + (0.114 * color.blue())
-    return QtGui.QColor("#1c1c1c" if luminance > 165 else "#ffffff")
+    text_color = _READABLE_CACHE[key] = QtGui.QColor("#1c1c1c" if luminance > 165 else "#ffffff")
+    return text_color
 
 def make_logo_pixmap(dark_mode: bool, target_width: int = 220) -> QtGui.QPixmap:
     assets_dir = resource_path("assets")
@@ -496,137 +872,135 @@ def fetch_latest_version(os_name: str) -> str | None:
     versions.sort(key=parse_version)
     return versions[-1]
 
-def make_gear_icon(palette: QtGui.QPalette, size: int = 18) -> QtGui.QIcon:
-    pixmap = QtGui.QPixmap(size, size)
-    pixmap.fill(QtCore.Qt.transparent)
-    painter = QtGui.QPainter(pixmap)
-    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-    font = QtGui.QFont()
-    font.setPointSize(int(size * 0.8))
-    painter.setFont(font)
-    painter.setPen(palette.color(QtGui.QPalette.Text))
-    painter.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, "⚙")
-    painter.end()
-
-    return QtGui.QIcon(pixmap)
+DARK_STYLESHEET = """
+    QPushButton, QToolButton {
+        background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+            stop:0 #2c2f3b, stop:1 #ff4d4f);
+        color: white;
+        border: 1px solid #ff8080;
+        border-radius: 4px;
+        padding: 4px 8px;
+    }
+    QPushButton:hover, QToolButton:hover {
+        background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+            stop:0 #ff5f6d, stop:1 #ffc371);
+        color: #1c1c1c;
+    }
+    QPushButton:disabled, QToolButton:disabled {
+        background-color: #2d2d2d;
+        color: rgba(255, 255, 255, 0.6);
+        border: 1px solid #555;
+    }
+    QLineEdit, QPlainTextEdit, QTextEdit {
+        background-color: #1f2128;
+        color: #ffcccc;
+        selection-background-color: #ff5f6d;
+        selection-color: #1c1c1c;
+        border: 1px solid #ff8080;
+        border-radius: 4px;
+        padding: 2px 4px;
+    }
+    QGroupBox::title {
+        color: #ffffff;
+    }
+    QHeaderView::section {
+        background-color: #1f1f24;
+        color: #ff7b7b;
+        border: 1px solid #ff8080;
+    }
+    QMessageBox {
+        background-color: #1f2128;
+    }
+    QMessageBox QLabel {
+        color: #ffffff;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ff8080;
+    }
+    QTabBar::tab {
+        background: #1f2128;
+        color: #ffcccc;
+        border: 1px solid #ff8080;
+        border-bottom: none;
+        padding: 4px 10px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background: #2c2f3b;
+        color: #ffffff;
+    }
+    """
+LIGHT_STYLESHEET = """
+    QPushButton, QToolButton {
+        background-color: #ff5f6d;
+        color: #ffffff;
+        border: 1px solid #e45b5b;
+        border-radius: 4px;
+        padding: 4px 10px;
+    }
+    QPushButton:hover, QToolButton:hover {
+        background-color: #ff7b7b;
+        color: #ffffff;
+    }
+    QPushButton:pressed, QToolButton:pressed {
+        background-color: #ff4d4f;
+        color: #ffffff;
+    }
+    QPushButton:disabled, QToolButton:disabled {
+        background-color: #d9d9d9;
+        color: #7a7a7a;
+        border: 1px solid #c7c7c7;
+    }
+    """
+DARK_PALETTE_COLORS = (
+    (QtGui.QPalette.Window, QtGui.QColor(22, 24, 30)),
+    (QtGui.QPalette.WindowText, QtGui.QColor(QtCore.Qt.white)),
+    (QtGui.QPalette.Base, QtGui.QColor(30, 32, 40)),
+    (QtGui.QPalette.AlternateBase, QtGui.QColor(42, 44, 54)),
+    (QtGui.QPalette.ToolTipBase, QtGui.QColor(QtCore.Qt.white)),
+    (QtGui.QPalette.ToolTipText, QtGui.QColor(QtCore.Qt.white)),
+    (QtGui.QPalette.Text, QtGui.QColor(QtCore.Qt.white)),
+    (QtGui.QPalette.Button, QtGui.QColor(36, 38, 48)),
+    (QtGui.QPalette.ButtonText, QtGui.QColor(255, 115, 115)),
+    (QtGui.QPalette.PlaceholderText, QtGui.QColor(255, 170, 170)),
+    (QtGui.QPalette.BrightText, QtGui.QColor(255, 255, 255)),
+    (QtGui.QPalette.Highlight, QtGui.QColor(255, 99, 132)),
+    (QtGui.QPalette.HighlightedText, QtGui.QColor(QtCore.Qt.white)),
+)
+_DARK_PALETTE: QtGui.QPalette | None = None
+_LIGHT_PALETTE: QtGui.QPalette | None = None
+_current_dark: bool | None = None
 
 def set_app_palette(dark: bool) -> None:
+    global _DARK_PALETTE, _LIGHT_PALETTE, _current_dark
     app = QtWidgets.QApplication.instance()
     if not app:
         return
+    if _current_dark == dark:
+        return
+    _current_dark = dark
 
     if dark:
-        palette = QtGui.QPalette()
-        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(22, 24, 30))
-        palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(30, 32, 40))
-        palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(42, 44, 54))
-        palette.setColor(QtGui.QPalette.ToolTipBase, QtCore.Qt.white)
-        palette.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-        palette.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-        palette.setColor(QtGui.QPalette.Button, QtGui.QColor(36, 38, 48))
-        palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(255, 115, 115))
-        palette.setColor(QtGui.QPalette.PlaceholderText, QtGui.QColor(255, 170, 170))
-        palette.setColor(QtGui.QPalette.BrightText, QtGui.QColor(255, 255, 255))
-        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(255, 99, 132))
-        palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-        app.setPalette(palette)
-        app.setStyleSheet(
-            """
-            QPushButton, QToolButton {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #2c2f3b, stop:1 #ff4d4f);
-                color: white;
-                border: 1px solid #ff8080;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover, QToolButton:hover {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #ff5f6d, stop:1 #ffc371);
-                color: #1c1c1c;
-            }
-            QPushButton:disabled, QToolButton:disabled {
-                background-color: #2d2d2d;
-                color: rgba(255, 255, 255, 0.6);
-                border: 1px solid #555;
-            }
-            QLineEdit, QPlainTextEdit, QTextEdit {
-                background-color: #1f2128;
-                color: #ffcccc;
-                selection-background-color: #ff5f6d;
-                selection-color: #1c1c1c;
-                border: 1px solid #ff8080;
-                border-radius: 4px;
-                padding: 2px 4px;
-            }
-            QGroupBox::title {
-                color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #1f1f24;
-                color: #ff7b7b;
-                border: 1px solid #ff8080;
-            }
-            QMessageBox {
-                background-color: #1f2128;
-            }
-            QMessageBox QLabel {
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ff8080;
-            }
-            QTabBar::tab {
-                background: #1f2128;
-                color: #ffcccc;
-                border: 1px solid #ff8080;
-                border-bottom: none;
-                padding: 4px 10px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: #2c2f3b;
-                color: #ffffff;
-            }
-            """
-        )
+        if _DARK_PALETTE is None:
+            _DARK_PALETTE = QtGui.QPalette()
+            for role, color in DARK_PALETTE_COLORS:
+                _DARK_PALETTE.setColor(role, color)
+        app.setPalette(_DARK_PALETTE)
+        app.setStyleSheet(DARK_STYLESHEET)
     else:
-        palette = QtWidgets.QApplication.style().standardPalette()
-        highlight_color = QtGui.QColor(255, 95, 109)
-        palette.setColor(QtGui.QPalette.Highlight, highlight_color)
-        palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-        app.setPalette(palette)
-        app.setStyleSheet(
-            """
-            QPushButton, QToolButton {
-                background-color: #ff5f6d;
-                color: #ffffff;
-                border: 1px solid #e45b5b;
-                border-radius: 4px;
-                padding: 4px 10px;
-            }
-            QPushButton:hover, QToolButton:hover {
-                background-color: #ff7b7b;
-                color: #ffffff;
-            }
-            QPushButton:pressed, QToolButton:pressed {
-                background-color: #ff4d4f;
-                color: #ffffff;
-            }
-            QPushButton:disabled, QToolButton:disabled {
-                background-color: #d9d9d9;
-                color: #7a7a7a;
-                border: 1px solid #c7c7c7;
-            }
-            """
-        )
+        if _LIGHT_PALETTE is None:
+            _LIGHT_PALETTE = QtWidgets.QApplication.style().standardPalette()
+            _LIGHT_PALETTE.setColor(QtGui.QPalette.Highlight, QtGui.QColor(255, 95, 109))
+            _LIGHT_PALETTE.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
+        app.setPalette(_LIGHT_PALETTE)
+        app.setStyleSheet(LIGHT_STYLESHEET)
 
 def toggle_autostart(parent: QtWidgets.QWidget) -> None:
-    enabled, error = autostart.status()
+    enabled, error = autostart_status()
     if error:
         QtWidgets.QMessageBox.warning(parent, "Autostart", error)
         return
+    _invalidate_autostart_status()
     if enabled:
         success, message = autostart.disable()
         if success:
@@ -717,11 +1091,10 @@ class BaseAddDialog(QtWidgets.QDialog):
         self.output_edit.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth)
         self.output_edit.setMinimumHeight(160)
 
-        self.code_edit = CodeEditor()
+        fixed_font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        self.code_edit = CodeEditor(font=fixed_font)
         self.code_edit.setPlaceholderText("Code block (will be wrapped for you)")
         self.code_edit.setMinimumHeight(160)
-        fixed_font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
-        self.code_edit.setFont(fixed_font)
 
         self.tab_widget.addTab(self.output_edit, "Text")
         self.tab_widget.addTab(self.code_edit, "Code block")
@@ -934,6 +1307,8 @@ class QuickAddDialog(BaseAddDialog):
         self.set_data("", text, focus_trigger=True)
 
 class SettingsDialog(QtWidgets.QDialog):
+    _profile_color_menu: QtWidgets.QMenu | None = None
+
     def __init__(self, parent: "MainWindow") -> None:  # type: ignore[name-defined]
         super().__init__(parent)
         self.window = parent
@@ -979,12 +1354,89 @@ class SettingsDialog(QtWidgets.QDialog):
         header_layout.addWidget(updates_container, 1, QtCore.Qt.AlignRight)
         layout.addLayout(header_layout)
 
+        self._row_by_name: dict[str, QtWidgets.QListWidgetItem] = {}
+        self.clipboard_checkbox = None
+        self._listening_target: str | None = None
+        self._listening_button: QtWidgets.QPushButton | None = None
+        self._listening_previous_label: str | None = None
+
+        self._build_sections(layout)
+
+        buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        buttons.accepted.connect(self.accept)
+        close_button = buttons.button(QtWidgets.QDialogButtonBox.Close)
+        if close_button:
+            close_button.setText("Close")
+        layout.addWidget(buttons)
+
+    def refresh(self) -> None:
+        """Resync the sections with the window state before the dialog is shown again."""
+        self.setWindowIcon(make_status_icon(self.window.enabled))
+        with QtCore.QSignalBlocker(self.autostart_checkbox):
+            self.autostart_checkbox.setChecked(is_autostart_enabled())
+        with QtCore.QSignalBlocker(self.dark_mode_checkbox):
+            self.dark_mode_checkbox.setChecked(self.window.dark_mode)
+        with QtCore.QSignalBlocker(self.hotkey_modifier_combo):
+            index = self.hotkey_modifier_combo.findText(self.window.hotkey_modifier.upper())
+            if index >= 0:
+                self.hotkey_modifier_combo.setCurrentIndex(index)
+        self.quick_add_hotkey_btn.setText(self._display_hotkey_key(self.window.quick_add_key))
+        self.profile_switch_hotkey_btn.setText(self._display_hotkey_key(self.window.profile_switch_key))
+        self.toggle_hotkey_btn.setText(self._display_hotkey_key(self.window.toggle_hotkey_key))
+        with QtCore.QSignalBlocker(self.encryption_checkbox):
+            self.encryption_checkbox.setChecked(bool(self.window.config.get("profiles_encrypted", False)))
+        self._update_encryption_controls()
+        self.refresh_profiles()
+        with QtCore.QSignalBlocker(self.logging_checkbox):
+            self.logging_checkbox.setChecked(bool(self.window.config.get("logging_enabled", False)))
+        self.log_path_edit.setText(str(self.window.config.get("log_file") or storage.default_log_path()))
+        self._update_logging_controls()
+
+    def _build_sections(self, layout: QtWidgets.QVBoxLayout) -> None:
+        content_layout = QtWidgets.QHBoxLayout()
+        left_column = QtWidgets.QVBoxLayout()
+        right_column = QtWidgets.QVBoxLayout()
+        left_column.setSpacing(12)
+        right_column.setSpacing(12)
+
+        general_group = self._build_general_group()
+        general_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        left_column.addWidget(general_group, 3)
+        data_group = self._build_data_group()
+        left_column.addWidget(data_group, 2)
+        privacy_group = self._build_security_group()
+        left_column.addWidget(privacy_group, 2)
+
+        profiles_group = self._build_profiles_group()
+        right_column.addWidget(profiles_group, 3)
+        logging_group = self._build_diagnostics_group()
+        right_column.addWidget(logging_group)
+        right_column.addStretch(2)
+        links_group = self._build_links_group()
+        right_column.addWidget(links_group, 1)
+
+        content_layout.addLayout(left_column, 1)
+        content_layout.addLayout(right_column, 1)
+        layout.addLayout(content_layout)
+        self.section_groups = [
+            general_group,
+            data_group,
+            privacy_group,
+            profiles_group,
+            logging_group,
+            links_group,
+        ]
+        self._apply_section_title_style()
+
+    def _build_general_group(self) -> QtWidgets.QGroupBox:
         general_group = QtWidgets.QGroupBox("General")
         general_layout = QtWidgets.QVBoxLayout(general_group)
 
+        autostart_enabled, autostart_error = autostart_status()
         self.autostart_checkbox = QtWidgets.QCheckBox("Launch OpenKeyFlow on startup")
-        self.autostart_checkbox.setChecked(is_autostart_enabled())
-        self.autostart_checkbox.setEnabled(autostart_supported())
+        self.autostart_checkbox.setChecked(autostart_enabled and autostart_error is None)
+        self.autostart_checkbox.setEnabled(autostart_error is None)
         self.autostart_checkbox.toggled.connect(self._on_autostart_toggled)
 
         self.dark_mode_checkbox = QtWidgets.QCheckBox("Enable dark mode")
@@ -992,7 +1444,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.dark_mode_checkbox.toggled.connect(self._on_dark_mode_toggled)
 
         general_layout.addWidget(self.autostart_checkbox)
-        if not autostart_supported():
+        if autostart_error is not None:
             hint = QtWidgets.QLabel("Autostart shortcuts are available on Windows systems.")
             hint.setWordWrap(True)
             general_layout.addWidget(hint)
@@ -1034,15 +1486,9 @@ class SettingsDialog(QtWidgets.QDialog):
         reset_hotkeys_row.addWidget(self.reset_hotkeys_btn)
         hotkeys_layout.addLayout(reset_hotkeys_row)
         general_layout.addWidget(hotkeys_group)
-        content_layout = QtWidgets.QHBoxLayout()
-        left_column = QtWidgets.QVBoxLayout()
-        right_column = QtWidgets.QVBoxLayout()
-        left_column.setSpacing(12)
-        right_column.setSpacing(12)
-
-        general_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        left_column.addWidget(general_group, 3)
+        return general_group
 
+    def _build_data_group(self) -> QtWidgets.QGroupBox:
         data_group = QtWidgets.QGroupBox("Data & Import/Export")
         data_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         data_layout = QtWidgets.QHBoxLayout(data_group)
@@ -1057,8 +1503,9 @@ class SettingsDialog(QtWidgets.QDialog):
         data_layout.addWidget(import_btn)
         data_layout.addWidget(export_btn)
         data_layout.addWidget(export_sample_btn)
-        left_column.addWidget(data_group, 2)
+        return data_group
 
+    def _build_security_group(self) -> QtWidgets.QGroupBox:
         privacy_group = QtWidgets.QGroupBox("Security")
         privacy_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         privacy_layout = QtWidgets.QVBoxLayout(privacy_group)
@@ -1077,11 +1524,10 @@ class SettingsDialog(QtWidgets.QDialog):
         self.change_passphrase_btn = QtWidgets.QPushButton("Change passphrase")
         self.change_passphrase_btn.clicked.connect(self._on_change_passphrase)
         privacy_layout.addWidget(self.change_passphrase_btn)
+        self._update_encryption_controls()
+        return privacy_group
 
-        self.clipboard_checkbox = None
-
-        left_column.addWidget(privacy_group, 2)
-
+    def _build_profiles_group(self) -> QtWidgets.QGroupBox:
         profiles_group = QtWidgets.QGroupBox("Profiles")
         profiles_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         profiles_layout = QtWidgets.QVBoxLayout(profiles_group)
@@ -1117,7 +1563,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.profile_color_btn = QtWidgets.QToolButton()
         self.profile_color_btn.setText("Choose color")
         self.profile_color_btn.setPopupMode(QtWidgets.QToolButton.InstantPopup)
-        self.profile_color_btn.setMenu(self._build_profile_color_menu())
+        self.profile_color_btn.setMenu(self._attach_profile_color_menu())
         self.profile_color_btn.setMinimumWidth(110)
         self.profile_color_btn.setMinimumHeight(28)
 
@@ -1126,27 +1572,31 @@ class SettingsDialog(QtWidgets.QDialog):
         profile_color_row.addWidget(self.profile_color_btn)
         profile_color_row.addStretch(1)
         profiles_layout.addLayout(profile_color_row)
+        self.refresh_profiles()
+        self.profile_list.currentItemChanged.connect(self._on_profile_selection_changed)
+        return profiles_group
 
-        right_column.addWidget(profiles_group, 3)
-
+    def _build_diagnostics_group(self) -> QtWidgets.QGroupBox:
         logging_group = QtWidgets.QGroupBox("Diagnostics")
         logging_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         logging_layout = QtWidgets.QGridLayout(logging_group)
-        right_column.addWidget(logging_group, 2)
         self.logging_checkbox = QtWidgets.QCheckBox("Enable debug logging")
         self.logging_checkbox.setChecked(bool(self.window.config.get("logging_enabled", False)))
         self.logging_checkbox.toggled.connect(self._on_logging_toggled)
         logging_layout.addWidget(self.logging_checkbox, 0, 0, 1, 2)
 
-        self.log_path_edit = QtWidgets.QLineEdit(str(self.window.config.get("log_file", storage.default_log_path())))
+        log_file = self.window.config.get("log_file") or storage.default_log_path()
+        self.log_path_edit = QtWidgets.QLineEdit(str(log_file))
         self.log_path_edit.setPlaceholderText("Log file path")
         self.browse_btn = QtWidgets.QPushButton("Choose…")
         self.browse_btn.clicked.connect(self._on_choose_log_path)
         logging_layout.addWidget(QtWidgets.QLabel("Log file:"), 1, 0)
         logging_layout.addWidget(self.log_path_edit, 1, 1)
         logging_layout.addWidget(self.browse_btn, 1, 2)
-        right_column.addWidget(logging_group)
+        self._update_logging_controls()
+        return logging_group
 
+    def _build_links_group(self) -> QtWidgets.QGroupBox:
         links_group = QtWidgets.QGroupBox("Links")
         links_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         links_layout = QtWidgets.QHBoxLayout(links_group)
@@ -1170,37 +1620,7 @@ class SettingsDialog(QtWidgets.QDialog):
         for button in (donate_btn, github_btn, help_btn):
             button.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
             links_layout.addWidget(button)
-        right_column.addWidget(links_group, 1)
-
-        content_layout.addLayout(left_column, 1)
-        content_layout.addLayout(right_column, 1)
-        layout.addLayout(content_layout)
-
-        buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Close)
-        buttons.rejected.connect(self.reject)
-        buttons.accepted.connect(self.accept)
-        close_button = buttons.button(QtWidgets.QDialogButtonBox.Close)
-        if close_button:
-            close_button.setText("Close")
-        layout.addWidget(buttons)
-
-        self._update_logging_controls()        
-        self._update_encryption_controls()
-        self.section_groups = [
-            general_group,
-            data_group,
-            privacy_group,
-            profiles_group,
-            logging_group,
-            links_group,
-        ]
-        self._listening_target: str | None = None
-        self._listening_button: QtWidgets.QPushButton | None = None
-        self._listening_previous_label: str | None = None
-        self._apply_section_title_style()
-        self.refresh_profiles()
-        self.profile_list.currentItemChanged.connect(self._on_profile_selection_changed)
-        self._refresh_profile_color_controls()
+        return links_group
 
     def _update_logging_controls(self) -> None:
         enabled = self.logging_checkbox.isChecked()
@@ -1460,18 +1880,33 @@ class SettingsDialog(QtWidgets.QDialog):
         self._update_logging_controls()
 
     def refresh_profiles(self) -> None:
-        self.profile_list.clear()
         current = self.window.current_profile
-        for name in self.window.profile_names():
+        names = self.window.profile_names()
+        for name in set(self._row_by_name) - set(names):
+            item = self._row_by_name.pop(name)
+            self.profile_list.takeItem(self.profile_list.row(item))
+        for row, name in enumerate(names):
+            item = self._row_by_name.get(name)
+            if item is None:
+                item = QtWidgets.QListWidgetItem()
+                item.setData(QtCore.Qt.UserRole, name)
+                self._row_by_name[name] = item
+                self.profile_list.insertItem(row, item)
+            elif self.profile_list.row(item) != row:
+                self.profile_list.insertItem(row, self.profile_list.takeItem(self.profile_list.row(item)))
             display = f"{name} (current)" if name == current else name
-            item = QtWidgets.QListWidgetItem(display)
-            item.setData(QtCore.Qt.UserRole, name)
+            if item.text() != display:
+                item.setText(display)
             color = self.window.profile_color(name)
-            if color:
-                swatch_color = QtGui.QColor(color)
-                item.setIcon(make_color_icon(swatch_color))
-                item.setForeground(QtGui.QBrush(swatch_color))
-            self.profile_list.addItem(item)
+            if item.data(PROFILE_COLOR_ROLE) != color:
+                item.setData(PROFILE_COLOR_ROLE, color)
+                if color:
+                    swatch_color = QtGui.QColor(color)
+                    item.setIcon(make_color_icon(swatch_color))
+                    item.setForeground(QtGui.QBrush(swatch_color))
+                else:
+                    item.setIcon(QtGui.QIcon())
+                    item.setData(QtCore.Qt.ForegroundRole, None)
         self._refresh_profile_color_controls()
 
     def _selected_profile_name(self) -> str | None:
@@ -1501,20 +1936,12 @@ class SettingsDialog(QtWidgets.QDialog):
         else:
             self.profile_color_preview.setStyleSheet("QFrame { background-color: transparent; border: 1px dashed #555; }")
 
-    def _build_profile_color_menu(self) -> QtWidgets.QMenu:
-        menu = QtWidgets.QMenu(self)
-        palette = [
-            ("Ruby", "#e74c3c"),
-            ("Coral", "#ff6b6b"),
-            ("Amber", "#f39c12"),
-            ("Lime", "#8bc34a"),
-            ("Teal", "#1abc9c"),
-            ("Sky", "#3498db"),
-            ("Indigo", "#5c6bc0"),
-            ("Violet", "#9b59b6"),
-            ("Slate", "#7f8c8d"),
-        ]
-        for name, hex_color in palette:
+    @classmethod
+    def _build_profile_color_menu(cls) -> QtWidgets.QMenu:
+        if cls._profile_color_menu is not None:
+            return cls._profile_color_menu
+        menu = QtWidgets.QMenu()
+        for name, hex_color in PROFILE_COLOR_PALETTE:
             action = menu.addAction(name)
             action.setData(hex_color)
             action.setIcon(make_color_icon(QtGui.QColor(hex_color)))
@@ -1523,6 +1950,15 @@ class SettingsDialog(QtWidgets.QDialog):
         clear_action.setData(None)
         custom_action = menu.addAction("Custom…")
         custom_action.setData("custom")
+        cls._profile_color_menu = menu
+        return menu
+
+    def _attach_profile_color_menu(self) -> QtWidgets.QMenu:
+        menu = self._build_profile_color_menu()
+        try:
+            menu.triggered.disconnect()
+        except TypeError:
+            pass
         menu.triggered.connect(self._on_profile_color_selected)
         return menu
 
@@ -1533,7 +1969,7 @@ class SettingsDialog(QtWidgets.QDialog):
         data = action.data()
         if data == "custom":
             current = self.window.profile_color(profile_name)
-            base = QtGui.QColor(current) if current else QtGui.QColor("#ff6b6b")
+            base = QtGui.QColor(current) if current else CUSTOM_COLOR_DEFAULT
             color = QtWidgets.QColorDialog.getColor(
                 base,
                 self,
@@ -1586,17 +2022,55 @@ class MainWindow(QtWidgets.QMainWindow):
         profiles_encrypted: bool = False,
     ) -> None:
         super().__init__()
+        self._app = QtWidgets.QApplication.instance()
         self.engine = engine
-        self.current_profile, self.profiles = storage.load_profiles(passphrase=profile_passphrase)
-        self.hotkeys: Dict[str, str] = dict(self.profiles.get(self.current_profile, {}))        
+        self.current_profile = storage.DEFAULT_PROFILE_NAME
+        self.profiles: Dict[str, Dict[str, str]] = {self.current_profile: {}}
+        self._profile_names_cache: list[str] | None = None
+        self.hotkeys: Dict[str, str] = {}
+        self._trigger_trie = TriggerTrie()
+        self._trie_source: Dict[str, str] | None = None
+        self._profiles_loaded = False
+        self._profile_load_thread: QtCore.QThread | None = None
+        self._profile_load_worker: ProfileLoadWorker | None = None
+        self._engine_pool = QtCore.QThreadPool(self)
+        self._engine_pool.setMaxThreadCount(1)
+        self._engine_task = EngineUpdateTask(self.engine)
+        self._profile_dirty: dict[str, bool] = {}
+        self._profiles_dirty = False
+        self._ui_batch_depth = 0
+        self._tray_menu_dirty = True
+        self._ui_refresh_pending: set[str] = set()
+        self._profile_flush_timer = QtCore.QTimer(self)
+        self._profile_flush_timer.setSingleShot(True)
+        self._profile_flush_timer.setInterval(5000)
+        self._profile_flush_timer.timeout.connect(self._flush_profiles_now)
+        self._profile_writer = ProfileWriter(self)
+        self._profile_writer.written.connect(self._on_profile_write_succeeded)
+        self._profile_writer.failed.connect(self._on_profile_write_failed)
+        self._profile_write_warned = False
+        self._profile_writer.start()
+        self._saved_profile = self.current_profile
         self.config = storage.load_config()
         self.config["profiles_encrypted"] = profiles_encrypted
+        self._config_dirty = False
+        self._config_flush_timer = QtCore.QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(500)
+        self._config_flush_timer.timeout.connect(self._flush_config)
         self.profile_colors: Dict[str, str] = self._normalize_profile_colors(
             self.config.get("profile_colors", {})
         )
+        self.config["profile_colors"] = self.profile_colors
+        self._profile_color_derived: dict[str, tuple[str, str, str, str]] = {}
+        self._profile_qcolor: dict[str, QtGui.QColor] = {}
+        self._button_css_cache: dict[str, str] = {}
+        self._profile_button_sheet = ""
+        self._default_accent_color = QtGui.QColor(DEFAULT_ACCENT_COLOR)
+        for name, color_hex in self.profile_colors.items():
+            self._update_profile_color_derived(name, color_hex)
         self.dark_mode = bool(self.config.get("dark_mode", False))
         self.enabled = True
-        self.hotkey_lock = threading.RLock()
         self.logger: Logger = logger or get_logger()
         self.profile_passphrase = profile_passphrase
         self.profiles_encrypted = profiles_encrypted
@@ -1630,13 +2104,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.config[key] = value
                 config_updated = True
         if config_updated:
-            storage.save_config(self.config)
+            self._mark_config_dirty()
 
         self._allow_close = False
 
         self.engine.set_cooldown(float(self.config.get("cooldown", 0.3)))
         self.engine.set_paste_delay(float(self.config.get("paste_delay", 0.05)))
-        self.engine.update_hotkeys(self.hotkeys)
         self.engine.set_logger(self.logger)
 
         self.setWindowTitle(APP_NAME)
@@ -1673,12 +2146,15 @@ class MainWindow(QtWidgets.QMainWindow):
         search_row = QtWidgets.QHBoxLayout()
         self.search_edit = QtWidgets.QLineEdit()
         self.search_edit.setPlaceholderText("Search triggers or outputs…")
+        self._search_completions = QtCore.QStringListModel(self)
+        completer = QtWidgets.QCompleter(self._search_completions, self)
+        # Triggers are case-sensitive, and so is the trie the completions come from.
+        completer.setCaseSensitivity(QtCore.Qt.CaseSensitive)
+        self.search_edit.setCompleter(completer)
         search_row.addWidget(self.search_edit, 1)
         layout.addLayout(search_row)
 
-        self.model = QtGui.QStandardItemModel(0, 2, self)
-        self.model.setHorizontalHeaderLabels(["Hotkey", "Output"])
-        self.populate_model()
+        self.model = HotkeyTableModel(self)
 
         self.proxy = HotkeyFilter()
         self.proxy.setSourceModel(self.model)
@@ -1689,7 +2165,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.verticalHeader().setVisible(False)
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setVisible(False)
+        # Rows keep the style's default height; Fixed stops per-row size queries.
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -1715,6 +2194,10 @@ class MainWindow(QtWidgets.QMainWindow):
         bottom_row = QtWidgets.QHBoxLayout()
         self.profile_menu = QtWidgets.QMenu(self)
         self.profile_menu.triggered.connect(self._on_profile_menu_triggered)
+        self._profile_actions: dict[str, QtWidgets.QAction] = {}
+        self._profile_menu_separator = self.profile_menu.addSeparator()
+        add_profile_action = self.profile_menu.addAction("Add new profile…")
+        add_profile_action.setData(None)
         self.profile_button = QtWidgets.QPushButton()
         self.profile_button.setMenu(self.profile_menu)
         bottom_row.addWidget(self.profile_button)
@@ -1741,6 +2224,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.fired_count_label = QtWidgets.QLabel()
         bottom_row.addWidget(self.hotkey_count_label)
         bottom_row.addWidget(self.fired_count_label)
+        self._last_hk_count = -1
+        self._last_fired = -1
+        self._counters_timer = QtCore.QTimer(self)
+        self._counters_timer.setSingleShot(True)
+        self._counters_timer.setInterval(100)
+        self._counters_timer.timeout.connect(self.refresh_counters_only)
+        self.updateCounters.connect(self.request_counters_refresh, QtCore.Qt.QueuedConnection)
 
         self.toggle_btn = QtWidgets.QToolButton()
         self.toggle_btn.setCheckable(True)
@@ -1757,7 +2247,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
         layout.addLayout(bottom_row)
 
-        self.search_edit.textChanged.connect(self.proxy.setQuery)
+        self._pending_query = ""
+        self._search_debounce = QtCore.QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(lambda: self.proxy.setQuery(self._pending_query))
+        self.search_edit.textChanged.connect(self._on_search_text_changed)
+        self._profile_menu_timer = QtCore.QTimer(self)
+        self._profile_menu_timer.setSingleShot(True)
+        self._profile_menu_timer.setInterval(50)
+        self._profile_menu_timer.timeout.connect(self._refresh_profile_menu)
         self.tray: QtWidgets.QSystemTrayIcon | None = None
         self.refresh_status_ui()
         self._refresh_profile_menu()
@@ -1765,15 +2264,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.counter_timer = QtCore.QTimer(self)
         self.counter_timer.setInterval(300)
         self.counter_timer.timeout.connect(self.refresh_counters_only)
-        self.counter_timer.start()
         self.tray = QtWidgets.QSystemTrayIcon(self)
-        self.tray.setIcon(make_status_icon(self.enabled))
+        self._tray_icon_key: int | None = None
+        make_status_icon(not self.enabled)
+        self._set_tray_icon(make_status_icon(self.enabled))
 
         self.tray_menu = QtWidgets.QMenu()
         self.tray_profile_menu = QtWidgets.QMenu("Profiles", self.tray_menu)
         self.tray_profile_menu.triggered.connect(self._on_tray_profile_triggered)
+        self.tray_profile_menu.aboutToShow.connect(self._refresh_tray_profile_menu_if_dirty)
+        self._tray_actions: dict[str, QtWidgets.QAction] = {}
+        self._tray_action_group = QtWidgets.QActionGroup(self.tray_profile_menu)
+        self._tray_action_group.setExclusive(True)
+        self._tray_profile_separator = self.tray_profile_menu.addSeparator()
+        self.tray_profile_menu.addAction("Create New Profile…")
         self.tray_menu.addAction("Toggle Enabled", self.toggle_enabled)
-        self.tray_menu.addAction("Settings", self.open_settings)
+        self.tray_settings_action = self.tray_menu.addAction("Settings", self.open_settings)
         self.tray_menu.addMenu(self.tray_profile_menu)
         self.tray_menu.addSeparator()
         self.tray_menu.addAction("Show/Hide", self.toggle_window_visibility)
@@ -1782,8 +2288,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tray.activated.connect(self._tray_activated)
         self.tray.setToolTip(APP_NAME)
         self.tray.show()
-        self._refresh_tray_profile_menu()
-        self._tray_active_icon = make_status_icon(True, override_color=QtGui.QColor("#f1c40f"))
+        self._tray_active_icon = make_status_icon(True, override_color=self._default_accent_color)
         self._active_fire_count = 0
 
         self.engine.set_fire_hooks(
@@ -1802,32 +2307,176 @@ class MainWindow(QtWidgets.QMainWindow):
         self._quick_add_toast: ProfileSwitchToast | None = None
         self.quick_add_dialog: QuickAddDialog | None = None
 
-        app = QtWidgets.QApplication.instance()
+        app = self._app
         if app:
+            app.aboutToQuit.connect(self._finish_profile_writes)
+            app.aboutToQuit.connect(self._flush_config)
             app.focusChanged.connect(self._on_focus_changed)
             self.engine.set_app_active(app.activeWindow() is not None)
 
         set_app_palette(self.dark_mode)
-        self._apply_table_header_theme()
+        self._start_profile_load(profile_passphrase)
         QtCore.QTimer.singleShot(200, self._maybe_show_use_policy_prompt)
 
+    def _schedule_engine_update(self) -> None:
+        if self._engine_task.submit(self.hotkeys):
+            self._engine_pool.start(self._engine_task)
+
+    def _start_profile_load(self, passphrase: str | None) -> None:
+        self.centralWidget().setEnabled(False)
+        self.tray_profile_menu.setEnabled(False)
+        self.tray_settings_action.setEnabled(False)
+        self._profile_load_thread = QtCore.QThread(self)
+        self._profile_load_worker = ProfileLoadWorker(passphrase)
+        self._profile_load_worker.moveToThread(self._profile_load_thread)
+        self._profile_load_thread.started.connect(self._profile_load_worker.run)
+        self._profile_load_worker.finished.connect(self._on_profiles_loaded)
+        self._profile_load_worker.locked.connect(self._on_profiles_locked)
+        self._profile_load_worker.failed.connect(self._on_profiles_load_failed)
+        for signal in (
+            self._profile_load_worker.finished,
+            self._profile_load_worker.locked,
+            self._profile_load_worker.failed,
+        ):
+            signal.connect(self._profile_load_thread.quit)
+        self._profile_load_thread.finished.connect(self._profile_load_thread.deleteLater)
+        self._profile_load_thread.start()
+
+    def _on_profiles_loaded(self, current_profile: str, profiles: Dict[str, Dict[str, str]]) -> None:
+        self._profile_load_thread = None
+        self.profile_passphrase = self._profile_load_worker.passphrase
+        current_profile = sys.intern(current_profile)
+        profiles = {sys.intern(name): hotkeys for name, hotkeys in profiles.items()}
+        self.current_profile = current_profile
+        self.profiles = profiles
+        self._invalidate_profile_names()
+        self.hotkeys = profiles.get(current_profile, {})
+        self._saved_profile = current_profile
+        self._profiles_loaded = True
+        self._schedule_engine_update()
+        self.populate_model()
+        self.refresh_status_ui()
+        self._sync_profile_ui()
+        self._sync_quick_add_dialog()
+        self.centralWidget().setEnabled(True)
+        self.tray_profile_menu.setEnabled(True)
+        self.tray_settings_action.setEnabled(True)
+
+    def _on_profiles_locked(self, message: str) -> None:
+        self._profile_load_thread = None
+        passphrase = self._profile_load_worker.passphrase
+        prompt = "Passphrase incorrect. Try again:" if passphrase else "Enter your profiles passphrase:"
+        passphrase_text, ok = QtWidgets.QInputDialog.getText(
+            self,
+            "Profiles Locked",
+            prompt,
+            QtWidgets.QLineEdit.Password,
+        )
+        if not ok:
+            self.quit_app()
+            return
+        passphrase = passphrase_text.strip() or None
+        if passphrase is None:
+            QtWidgets.QMessageBox.warning(self, "Profiles Locked", message)
+        self._start_profile_load(passphrase)
+
+    def _on_profiles_load_failed(self, message: str) -> None:
+        self._profile_load_thread = None
+        self.logger.error("Failed to load profiles: %s", message)
+        response = QtWidgets.QMessageBox.warning(
+            self,
+            "Profiles",
+            f"Failed to load profiles: {message}",
+            QtWidgets.QMessageBox.Retry | QtWidgets.QMessageBox.Close,
+            QtWidgets.QMessageBox.Retry,
+        )
+        if response == QtWidgets.QMessageBox.Retry:
+            self._start_profile_load(self._profile_load_worker.passphrase)
+        else:
+            self.quit_app()
+
     # ------------------------------------------------------------------
     # UI helpers
     # ------------------------------------------------------------------
+    def _require_profiles_loaded(self, title: str) -> bool:
+        # Until the load finishes, self.profiles is a placeholder that must never be saved or edited.
+        if self._profiles_loaded:
+            return True
+        QtWidgets.QMessageBox.warning(self, title, "Profiles are still loading.")
+        return False
+
     def _compose_hotkey(self, key: str) -> str:
         normalized_key = normalize_hotkey_key(key)
         if not normalized_key:
             return ""
         return f"{self.hotkey_modifier}+{normalized_key}"
     
+    @contextlib.contextmanager
+    def _sorting_suspended(self) -> typing.Iterator[None]:
+        self.table.setSortingEnabled(False)
+        self.proxy.setDynamicSortFilter(False)
+        try:
+            yield
+        finally:
+            # Re-enabling dynamic sorting re-sorts once on the proxy's kept
+            # column; the view then finds the proxy already sorted.
+            self.proxy.setDynamicSortFilter(True)
+            self.table.setSortingEnabled(True)
+
+    @contextlib.contextmanager
+    def _batch_ui(self) -> typing.Iterator[None]:
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if self._ui_batch_depth == 0:
+                self._flush_ui_refresh()
+
+    def _queue_ui_refresh(self, *parts: str) -> None:
+        self._ui_refresh_pending.update(parts)
+        if self._ui_batch_depth == 0:
+            self._flush_ui_refresh()
+
+    def _flush_ui_refresh(self) -> None:
+        pending = self._ui_refresh_pending
+        self._ui_refresh_pending = set()
+        if "model" in pending:
+            self.populate_model()
+        if "status" in pending:
+            self.refresh_status_ui()
+        if "profiles" in pending:
+            self._sync_profile_ui()
+
     def populate_model(self) -> None:
-        self.model.setRowCount(0)
-        for trigger, output in self.hotkeys.items():
-            items = [QtGui.QStandardItem(trigger), QtGui.QStandardItem(output)]
-            self.model.appendRow(items)
+        with self._sorting_suspended():
+            self.model.reset(self.hotkeys)
+
+    def _trigger_index(self) -> TriggerTrie:
+        if self._trie_source is not self.hotkeys:
+            self._trigger_trie = TriggerTrie(self.hotkeys)
+            self._trie_source = self.hotkeys
+        return self._trigger_trie
+
+    def _advance_trigger_index(
+        self,
+        previous: Dict[str, str],
+        *,
+        added: typing.Iterable[str] = (),
+        removed: typing.Iterable[str] = (),
+    ) -> None:
+        # The trie is only patched when it mirrors the snapshot being replaced;
+        # otherwise it is rebuilt on the next lookup.
+        if self._trie_source is not previous:
+            return
+        for trigger in removed:
+            self._trigger_trie.discard(trigger)
+        for trigger in added:
+            self._trigger_trie.add(trigger)
+        self._trie_source = self.hotkeys
 
     def _run_on_ui_thread(self, action: Callable[[], None]) -> None:
-        app = QtWidgets.QApplication.instance()
+        app = self._app
         if app is None:
             action()
             return
@@ -1837,17 +2486,16 @@ class MainWindow(QtWidgets.QMainWindow):
             QtCore.QTimer.singleShot(0, action)
 
     def refresh_status_ui(self) -> None:
-        self.refresh_counters_only()
+        self.request_counters_refresh()
         status_icon = make_status_icon(self.enabled)
         self.toggle_btn.setChecked(self.enabled)
         self.toggle_btn.setIcon(status_icon)
         self.toggle_btn.setToolTip("Click to disable hotkeys" if self.enabled else "Click to enable hotkeys")
         self.setWindowIcon(status_icon)
-        app = QtWidgets.QApplication.instance()
-        if app:
-            app.setWindowIcon(status_icon)
+        if self._app:
+            self._app.setWindowIcon(status_icon)
         if self.tray is not None and not self._is_outputting:
-            self.tray.setIcon(status_icon)
+            self._set_tray_icon(status_icon)
 
     def _apply_table_header_theme(self) -> None:
         header = self.table.horizontalHeader()
@@ -1871,9 +2519,7 @@ class MainWindow(QtWidgets.QMainWindow):
         hotkeys: list[tuple[str, str]] = []
         for index in selection:
             source = self.proxy.mapToSource(index)
-            trigger = self.model.item(source.row(), 0).text()
-            output = self.model.item(source.row(), 1).text()
-            hotkeys.append((trigger, output))
+            hotkeys.append(self.model.row_at(source.row()))
         return hotkeys
 
     def copy_selected_hotkeys(self) -> None:
@@ -1904,7 +2550,9 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Paste Hotkeys", "Clipboard data is not valid.")
             return
 
+        previous = self.hotkeys
         incoming: list[tuple[str, str]] = []
+        conflicts = 0
         for item in payload:
             if not isinstance(item, dict):
                 continue
@@ -1914,20 +2562,19 @@ class MainWindow(QtWidgets.QMainWindow):
                 trigger = trigger.strip()
                 if trigger:
                     incoming.append((trigger, output))
+                    if trigger in previous:
+                        conflicts += 1
 
         if not incoming:
             QtWidgets.QMessageBox.information(self, "Paste Hotkeys", "No hotkeys found to paste.")
             return
 
-        with self.hotkey_lock:
-            conflicts = [trigger for trigger, _ in incoming if trigger in self.hotkeys]
-
         overwrite = False
         if conflicts:
             response = QtWidgets.QMessageBox.question(
                 self,
                 "Paste Hotkeys",
-                f"{len(conflicts)} hotkeys already exist. Replace them?",
+                f"{conflicts} hotkeys already exist. Replace them?",
                 QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
                 QtWidgets.QMessageBox.No,
             )
@@ -1935,20 +2582,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
         added = 0
         replaced = 0
-        with self.hotkey_lock:
-            for trigger, output in incoming:
-                if trigger in self.hotkeys and not overwrite:
-                    continue
-                if trigger in self.hotkeys:
-                    replaced += 1
-                else:
-                    added += 1
-                self.hotkeys[trigger] = output
+        hotkeys = dict(previous)
+        pasted: list[tuple[str, str]] = []
+        for trigger, output in incoming:
+            if trigger in hotkeys and not overwrite:
+                continue
+            if trigger in hotkeys:
+                replaced += 1
+            else:
+                added += 1
+            hotkeys[trigger] = output
+            pasted.append((trigger, output))
+        self.hotkeys = hotkeys
+        self._advance_trigger_index(previous, added=[trigger for trigger, _ in pasted])
 
         if added or replaced:
+            self._profile_dirty[self.current_profile] = True
             self._save_current_profile()
-            self.engine.update_hotkeys(self.hotkeys)
-            self.populate_model()
+            self._schedule_engine_update()
+            with self._sorting_suspended():
+                self.model.upsert(pasted)
             self.refresh_status_ui()
             message = f"Added {added} hotkeys."
             if replaced:
@@ -1962,13 +2615,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _notify_fire_end(self) -> None:
         QtCore.QTimer.singleShot(0, self._stop_tray_flash)
+        self.updateCounters.emit()
 
     def _start_tray_flash(self) -> None:
         self._active_fire_count += 1
         if self._active_fire_count == 1:
             self._is_outputting = True
             if self.tray is not None:
-                self.tray.setIcon(self._tray_active_icon)
+                self._set_tray_icon(self._tray_active_icon)
 
     def _stop_tray_flash(self) -> None:
         if self._active_fire_count == 0:
@@ -1977,13 +2631,19 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._active_fire_count == 0:
             self._is_outputting = False
             if self.tray is not None:
-                self.tray.setIcon(make_status_icon(self.enabled))
+                self._set_tray_icon(make_status_icon(self.enabled))
+
+    def _set_tray_icon(self, icon: QtGui.QIcon) -> None:
+        key = icon.cacheKey()
+        if key == self._tray_icon_key:
+            return
+        self._tray_icon_key = key
+        self.tray.setIcon(icon)
 
     def _on_focus_changed(self, _old: QtWidgets.QWidget | None, _new: QtWidgets.QWidget | None) -> None:
-        app = QtWidgets.QApplication.instance()
-        if not app:
+        if not self._app:
             return
-        self.engine.set_app_active(app.activeWindow() is not None)
+        self.engine.set_app_active(self._app.activeWindow() is not None)
 
     def set_dark_mode(self, enabled: bool) -> None:
         self.dark_mode = enabled
@@ -1991,7 +2651,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_table_header_theme()
         self._apply_profile_button_color()
         self.config["dark_mode"] = self.dark_mode
-        storage.save_config(self.config)
+        self._mark_config_dirty()
         if self.settings_dialog:
             self.settings_dialog._apply_section_title_style()
             self.settings_dialog._apply_theme_assets()
@@ -2129,7 +2789,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.config["profile_switch_key"] = self.profile_switch_key
         self.config["toggle_hotkey_key"] = self.toggle_hotkey_key
         self.config["quick_add_hotkey"] = self.quick_add_hotkey
-        storage.save_config(self.config)
+        self._mark_config_dirty()
 
     def _rebuild_global_hotkeys(self, previous_hotkeys: Dict[str, str]) -> None:
         if not self.engine.hooks_available():
@@ -2193,10 +2853,10 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
     def set_logging_enabled(self, enabled: bool, path: Path | None = None) -> None:
-        log_path = Path(path) if path else Path(self.config.get("log_file", storage.default_log_path()))
+        log_path = Path(path) if path else Path(self.config.get("log_file") or storage.default_log_path())
         self.config["logging_enabled"] = enabled
         self.config["log_file"] = str(log_path)
-        storage.save_config(self.config)
+        self._mark_config_dirty()
         try:
             configure_logging(enabled, log_path)
             self.logger = get_logger()
@@ -2208,11 +2868,11 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"Failed to configure logging at {log_path}:\n{exc}",
             )
             self.config["logging_enabled"] = False
-            storage.save_config(self.config)
+            self._mark_config_dirty()
 
     def set_logging_path(self, path: Path) -> None:
         self.config["log_file"] = str(path)
-        storage.save_config(self.config)
+        self._mark_config_dirty()
         try:
             configure_logging(bool(self.config.get("logging_enabled", False)), path)
             self.logger = get_logger()
@@ -2225,6 +2885,8 @@ class MainWindow(QtWidgets.QMainWindow):
             )
 
     def set_profiles_encrypted(self, enabled: bool) -> bool:
+        if not self._require_profiles_loaded("Encrypt Profiles" if enabled else "Decrypt Profiles"):
+            return False
         if enabled:
             result = self._prompt_new_passphrase(
                 "Encrypt Profiles",
@@ -2233,6 +2895,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if not result:
                 return False
             passphrase, recovery_code = result
+            self._settle_profile_writes()
             try:
                 storage.save_profiles(self.current_profile, self.profiles, passphrase=passphrase)
             except Exception as exc:
@@ -2246,7 +2909,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.profile_passphrase = passphrase
             self.config["profiles_encrypted"] = True
             self.config["profile_recovery_code"] = recovery_code
-            storage.save_config(self.config)
+            self._save_config_now()
             return True
 
         if not self.profiles_encrypted:
@@ -2258,6 +2921,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not passphrase:
             return False
+        self._settle_profile_writes()
         try:
             storage.load_profiles(passphrase=passphrase)
         except storage.ProfilesEncryptionError as exc:
@@ -2275,10 +2939,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.profiles_encrypted = False
         self.profile_passphrase = None
         self.config["profiles_encrypted"] = False
-        storage.save_config(self.config)
+        self._save_config_now()
         return True
 
     def change_profiles_passphrase(self) -> None:
+        if not self._require_profiles_loaded("Change Passphrase"):
+            return
         if not self.profiles_encrypted:
             QtWidgets.QMessageBox.information(
                 self,
@@ -2292,6 +2958,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not current_passphrase:
             return
+        self._settle_profile_writes()
         try:
             storage.load_profiles(passphrase=current_passphrase)
         except storage.ProfilesEncryptionError as exc:
@@ -2316,7 +2983,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.profile_passphrase = new_passphrase
         self.config["profiles_encrypted"] = True
         self.config["profile_recovery_code"] = recovery_code
-        storage.save_config(self.config)
+        self._save_config_now()
 
     def _prompt_passphrase(self, title: str, prompt: str, *, confirm: bool = False) -> str | None:
         passphrase, ok = QtWidgets.QInputDialog.getText(
@@ -2361,13 +3028,11 @@ class MainWindow(QtWidgets.QMainWindow):
         return set_autostart_enabled(self, enabled)
 
     def open_settings(self) -> None:
-        dialog = SettingsDialog(self)
-        self.settings_dialog = dialog
-        dialog.finished.connect(self._on_settings_closed)
-        dialog.exec_()
-
-    def _on_settings_closed(self) -> None:
-        self.settings_dialog = None
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self)
+        else:
+            self.settings_dialog.refresh()
+        self.settings_dialog.exec_()
 
     def _maybe_show_use_policy_prompt(self) -> None:
         if self.config.get("accepted_use_policy"):
@@ -2388,14 +3053,47 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if result == QtWidgets.QMessageBox.Ok:
             self.config["accepted_use_policy"] = True
-            storage.save_config(self.config)
+            self._mark_config_dirty()
         else:
-            QtWidgets.QApplication.instance().quit()
+            self._app.quit()
+
+    def _on_search_text_changed(self, text: str) -> None:
+        self._pending_query = text
+        self._search_debounce.start()
+        completions = self._trigger_index().keys(text, limit=SEARCH_COMPLETION_LIMIT) if text else []
+        self._search_completions.setStringList(completions)
+
+    def _mark_config_dirty(self) -> None:
+        self._config_dirty = True
+        self._config_flush_timer.start()
+
+    def _flush_config(self) -> None:
+        self._config_flush_timer.stop()
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        storage.save_config(self.config)
+
+    def _save_config_now(self) -> None:
+        # The encryption flag must reach disk together with the re-written profiles.
+        self._config_dirty = True
+        self._flush_config()
+
+    def request_counters_refresh(self) -> None:
+        if not self._counters_timer.isActive():
+            self._counters_timer.start()
 
     def refresh_counters_only(self) -> None:
+        if not self.isVisible():
+            return
         fired = self.engine.get_stats()["fired"]
-        self.hotkey_count_label.setText(f"Hotkeys: {len(self.hotkeys)}")
-        self.fired_count_label.setText(f"Fired: {fired}")
+        hotkey_count = len(self.hotkeys)
+        if hotkey_count != self._last_hk_count:
+            self._last_hk_count = hotkey_count
+            self.hotkey_count_label.setText(f"Hotkeys: {hotkey_count}")
+        if fired != self._last_fired:
+            self._last_fired = fired
+            self.fired_count_label.setText(f"Fired: {fired}")
 
     def toggle_window_visibility(self) -> None:
         if self.isVisible():
@@ -2406,11 +3104,22 @@ class MainWindow(QtWidgets.QMainWindow):
             self.activateWindow()
             self.raise_()
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802 - Qt override
+        super().showEvent(event)
+        if not self.counter_timer.isActive():
+            self.refresh_counters_only()
+            self.counter_timer.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # noqa: N802 - Qt override
+        super().hideEvent(event)
+        self.counter_timer.stop()
+        self._flush_profiles_now()
+
     def _handle_return_pressed(self) -> None:
         trigger = self.key_edit.text()
         output = self.value_edit.text()
         if trigger and output:
-            self.add_hotkey()
+            self._submit_inline_hotkey(trigger, output)
         elif not trigger and not output:
             self.open_special_add()
         elif not trigger:
@@ -2428,6 +3137,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.hide()
         self._was_hidden_to_tray = True
+        self._flush_profiles_now()
+        self._flush_config()
         if self.tray and not self._tray_message_shown:
             self.tray.showMessage(APP_NAME, "OpenKeyFlow is still running in the system tray. Use Quit to exit.")
             self._tray_message_shown = True
@@ -2443,15 +3154,26 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.engine.remove_hotkey(self.quick_add_hotkey)
         except Exception:
             self.logger.exception("Failed to remove global hotkeys during shutdown")
+        if self._profile_load_thread is not None:
+            self._profile_load_thread.wait()
+        self._engine_pool.waitForDone()
+        try:
+            self._save_current_profile()
+            self._finish_profile_writes()
+        except Exception:
+            self.logger.exception("Failed to save profiles during shutdown")
+        self._counters_timer.stop()
+        self._flush_config()
         self._allow_close = True
-        QtWidgets.QApplication.instance().quit()
+        self._app.quit()
 
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
     def add_hotkey(self) -> None:
-        trigger = self.key_edit.text()
-        output = self.value_edit.text()
+        self._submit_inline_hotkey(self.key_edit.text(), self.value_edit.text())
+
+    def _submit_inline_hotkey(self, trigger: str, output: str) -> None:
         if not trigger and not output:
             self.open_special_add()
             return
@@ -2464,8 +3186,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def open_special_add(self) -> None:
         dialog = SpecialAddDialog(self)
-        color_hex = self.profile_color(self.current_profile) or "#f1c40f"
-        dialog.set_header_color(QtGui.QColor(color_hex))
+        dialog.set_header_color(self._profile_accent_color(self.current_profile))
         dialog.set_theme(self.dark_mode)
         hotkey_label = self._compose_hotkey(self.profile_switch_key)
         dialog.set_profile_info(
@@ -2514,17 +3235,19 @@ class MainWindow(QtWidgets.QMainWindow):
         if not output:
             QtWidgets.QMessageBox.warning(self, "Add Hotkey", "Output is required.")
             return False
+        if not self._require_profiles_loaded("Add Hotkey"):
+            return False
 
-        with self.hotkey_lock:
-            if normalized_trigger in self.hotkeys:
-                QtWidgets.QMessageBox.warning(self, "Add Hotkey", "Trigger already exists.")
-                return False
-            overlaps = [
-                existing
-                for existing in self.hotkeys
-                if existing != normalized_trigger
-                and (existing.startswith(normalized_trigger) or normalized_trigger.startswith(existing))
-            ]
+        hotkeys = self.hotkeys
+        if normalized_trigger in hotkeys:
+            QtWidgets.QMessageBox.warning(self, "Add Hotkey", "Trigger already exists.")
+            return False
+        trie = self._trigger_index()
+        overlaps = [
+            existing
+            for existing in trie.prefixes(normalized_trigger) + trie.keys(normalized_trigger)
+            if existing != normalized_trigger
+        ]
 
         if overlaps:
             overlaps_text = "\n".join(f"• {name}" for name in overlaps)
@@ -2542,15 +3265,17 @@ class MainWindow(QtWidgets.QMainWindow):
             if response != QtWidgets.QMessageBox.Yes:
                 return False
 
-        with self.hotkey_lock:
-            if normalized_trigger in self.hotkeys:
-                QtWidgets.QMessageBox.warning(self, "Add Hotkey", "Trigger already exists.")
-                return False
-            self.hotkeys[normalized_trigger] = output
+        if normalized_trigger in self.hotkeys:
+            QtWidgets.QMessageBox.warning(self, "Add Hotkey", "Trigger already exists.")
+            return False
+        previous = self.hotkeys
+        self.hotkeys = {**previous, normalized_trigger: output}
+        self._advance_trigger_index(previous, added=[normalized_trigger])
 
+        self._profile_dirty[self.current_profile] = True
         self._save_current_profile()
-        self.engine.update_hotkeys(self.hotkeys)
-        self.populate_model()
+        self._schedule_engine_update()
+        self.model.add(normalized_trigger, output)
         self.refresh_status_ui()
         return True
 
@@ -2558,11 +3283,7 @@ class MainWindow(QtWidgets.QMainWindow):
         selection = self.table.selectionModel().selectedRows()
         if not selection:
             return
-        to_delete = []
-        for index in selection:
-            source = self.proxy.mapToSource(index)
-            trigger = self.model.item(source.row(), 0).text()
-            to_delete.append(trigger)
+        to_delete = [index.data(QtCore.Qt.UserRole) for index in selection]
         if not to_delete:
             return
         count = len(to_delete)
@@ -2576,19 +3297,25 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if response != QtWidgets.QMessageBox.Yes:
             return
-        with self.hotkey_lock:
-            for trigger in to_delete:
-                self.hotkeys.pop(trigger, None)
+        previous = self.hotkeys
+        hotkeys = dict(previous)
+        for trigger in to_delete:
+            hotkeys.pop(trigger, None)
+        self.hotkeys = hotkeys
+        self._advance_trigger_index(previous, removed=to_delete)
+        self._profile_dirty[self.current_profile] = True
         self._save_current_profile()
-        self.engine.update_hotkeys(self.hotkeys)
-        self.populate_model()
+        self._schedule_engine_update()
+        self.model.remove(to_delete)
         self.refresh_status_ui()
 
     def import_csv(self) -> None:
+        if not self._require_profiles_loaded("Import"):
+            return
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import CSV", "", "CSV Files (*.csv)")
         if not path:
             return        
-        incoming = list(storage.import_hotkeys_from_csv(Path(path)))
+        incoming = dict(storage.import_hotkeys_from_csv(Path(path)))
         if not incoming:
             QtWidgets.QMessageBox.information(self, "Import", "No hotkeys found to import.")
             return
@@ -2670,7 +3397,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 if not name:
                     QtWidgets.QMessageBox.warning(dialog, "Import Hotkeys", "Profile name cannot be empty.")
                     return
-                if name in self.profiles:
+                if self.has_profile(name):
                     QtWidgets.QMessageBox.warning(dialog, "Import Hotkeys", "That profile already exists.")
                     return
             dialog.accept()
@@ -2695,32 +3422,38 @@ class MainWindow(QtWidgets.QMainWindow):
     def _import_hotkeys_to_profile(
         self,
         profile_name: str,
-        incoming: list[tuple[str, str]],
+        incoming: Dict[str, str],
         switch_to: bool,
     ) -> int:
-        added = 0
-        with self.hotkey_lock:
-            self.profiles[self.current_profile] = dict(self.hotkeys)
-            profile_hotkeys = dict(self.profiles.get(profile_name, {}))
-            for trigger, output in incoming:
-                profile_hotkeys[trigger] = output
-                added += 1
-            self.profiles[profile_name] = profile_hotkeys
+        self.profiles[self.current_profile] = self.hotkeys
+        existing = self.profiles.get(profile_name, {})
+        changed = {
+            trigger: output
+            for trigger, output in incoming.items()
+            if existing.get(trigger) != output
+        }
+        if profile_name not in self.profiles:
+            self._invalidate_profile_names()
+        self.profiles[profile_name] = {**existing, **changed}
+        added = len(changed)
 
         if switch_to:
             self.current_profile = profile_name
-            self.hotkeys = dict(self.profiles[profile_name])
-            self.engine.update_hotkeys(self.hotkeys)
+            self.hotkeys = self.profiles[profile_name]
+            self._schedule_engine_update()
             self.populate_model()
             self.refresh_status_ui()
         elif profile_name == self.current_profile:
-            self.hotkeys = dict(self.profiles[profile_name])
-            self.engine.update_hotkeys(self.hotkeys)
-            self.populate_model()
+            previous = self.hotkeys
+            self.hotkeys = self.profiles[profile_name]
+            self._advance_trigger_index(previous, added=changed)
+            self._schedule_engine_update()
+            with self._sorting_suspended():
+                self.model.upsert(changed.items())
             self.refresh_status_ui()
 
-        passphrase = self.profile_passphrase if self.profiles_encrypted else None
-        storage.save_profiles(self.current_profile, self.profiles, passphrase=passphrase)
+        self._profile_dirty[self.current_profile] = True
+        self._save_current_profile()
         self._sync_profile_ui()
         return added
 
@@ -2735,7 +3468,15 @@ class MainWindow(QtWidgets.QMainWindow):
     # Profiles
     # ------------------------------------------------------------------
     def profile_names(self) -> list[str]:
-        return list(self.profiles.keys())
+        if self._profile_names_cache is None:
+            self._profile_names_cache = list(self.profiles)
+        return self._profile_names_cache
+
+    def _invalidate_profile_names(self) -> None:
+        self._profile_names_cache = None
+
+    def has_profile(self, name: str) -> bool:
+        return name in self.profiles
 
     def profile_color(self, name: str) -> str | None:
         color = self.profile_colors.get(name)
@@ -2746,21 +3487,26 @@ class MainWindow(QtWidgets.QMainWindow):
     def set_profile_color(self, name: str, color: str | None) -> None:
         if not name:
             return
+        current = self.profile_colors.get(name)
+        if (color or None) == (current or None):
+            return
         if color:
             self.profile_colors[name] = color
         else:
             self.profile_colors.pop(name, None)
-        self.config["profile_colors"] = dict(self.profile_colors)
-        storage.save_config(self.config)
+        self._update_profile_color_derived(name, color)
+        self._mark_config_dirty()
         self._apply_profile_button_color()
         self._sync_profile_ui()
         self._sync_quick_add_dialog()
         if name == self.current_profile:
             self._sync_active_add_dialog()
 
+    def _profile_accent_color(self, name: str) -> QtGui.QColor:
+        return self._profile_qcolor.get(name, self._default_accent_color)
+
     def _show_profile_switch_toast(self, profile_name: str) -> None:
-        color_hex = self.profile_color(profile_name) or "#f1c40f"
-        color = QtGui.QColor(color_hex)
+        color = self._profile_accent_color(profile_name)
         if self._profile_toast is not None:
             self._profile_toast.close()
         message = f"Switched to profile: {profile_name}"
@@ -2768,7 +3514,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._profile_toast.show_toast()
 
     def _show_quick_add_toast(self, message: str) -> None:
-        color = QtGui.QColor("#f1c40f")
+        color = self._default_accent_color
         if self._quick_add_toast is not None:
             self._quick_add_toast.close()
         self._quick_add_toast = ProfileSwitchToast(message, color)
@@ -2793,8 +3539,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _sync_quick_add_dialog(self) -> None:
         if self.quick_add_dialog is None:
             return
-        color_hex = self.profile_color(self.current_profile) or "#f1c40f"
-        self.quick_add_dialog.set_header_color(QtGui.QColor(color_hex))
+        self.quick_add_dialog.set_header_color(self._profile_accent_color(self.current_profile))
         self.quick_add_dialog.set_theme(self.dark_mode)
         hotkey_label = self._compose_hotkey(self.profile_switch_key)
         self.quick_add_dialog.set_profile_info(
@@ -2803,14 +3548,13 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def _sync_active_add_dialog(self) -> None:
-        app = QtWidgets.QApplication.instance()
+        app = self._app
         if not app:
             return
         active_modal = app.activeModalWidget()
         if not isinstance(active_modal, BaseAddDialog):
             return
-        color_hex = self.profile_color(self.current_profile) or "#f1c40f"
-        active_modal.set_header_color(QtGui.QColor(color_hex))
+        active_modal.set_header_color(self._profile_accent_color(self.current_profile))
         active_modal.set_theme(self.dark_mode)
         hotkey_label = self._compose_hotkey(self.profile_switch_key)
         active_modal.set_profile_info(
@@ -2838,45 +3582,74 @@ class MainWindow(QtWidgets.QMainWindow):
             return "macos"
         return "windows"
 
-    def _refresh_profile_combo(self) -> None:
-        self._refresh_profile_menu()
+    def _sync_profile_actions(
+        self,
+        menu: QtWidgets.QMenu,
+        actions: dict[str, QtWidgets.QAction],
+        anchor: QtWidgets.QAction,
+        group: QtWidgets.QActionGroup | None = None,
+    ) -> None:
+        menu.setUpdatesEnabled(False)
+        try:
+            names = self.profile_names()
+            for name in set(actions) - set(names):
+                action = actions.pop(name)
+                if group is not None:
+                    group.removeAction(action)
+                menu.removeAction(action)
+                action.deleteLater()
+            for name in names:
+                action = actions.get(name)
+                if action is None:
+                    action = QtWidgets.QAction(name, menu)
+                    action.setData(name)
+                    if group is not None:
+                        action.setCheckable(True)
+                        group.addAction(action)
+                    menu.insertAction(anchor, action)
+                    actions[name] = action
+                color = self.profile_color(name)
+                icon = make_color_icon(QtGui.QColor(color)) if color else QtGui.QIcon()
+                if action.icon().cacheKey() != icon.cacheKey():
+                    action.setIcon(icon)
+                if group is not None and action.isChecked() != (name == self.current_profile):
+                    action.setChecked(name == self.current_profile)
+            ordered = [actions[name] for name in names]
+            listed = set(ordered)
+            if [action for action in menu.actions() if action in listed] != ordered:
+                # New and renamed profiles land at the anchor; restore profile_names() order.
+                for action in ordered:
+                    menu.removeAction(action)
+                for action in ordered:
+                    menu.insertAction(anchor, action)
+        finally:
+            menu.setUpdatesEnabled(True)
 
     def _refresh_profile_menu(self) -> None:
-        self.profile_menu.clear()
-        for name in self.profile_names():
-            action = self.profile_menu.addAction(name)
-            action.setData(name)
-            color = self.profile_color(name)
-            if color:
-                action.setIcon(make_color_icon(QtGui.QColor(color)))
-        self.profile_menu.addSeparator()
-        add_action = self.profile_menu.addAction("Add new profile…")
-        add_action.setData(None)
+        self._sync_profile_actions(self.profile_menu, self._profile_actions, self._profile_menu_separator)
         self.profile_button.setText(f"Profile: {self.current_profile}")
         self._apply_profile_button_color()
+        self._tray_menu_dirty = True
+
+    def _refresh_tray_profile_menu_if_dirty(self) -> None:
+        if not self._tray_menu_dirty:
+            return
+        self._tray_menu_dirty = False
         self._refresh_tray_profile_menu()
 
     def _refresh_tray_profile_menu(self) -> None:
         if not hasattr(self, "tray_profile_menu") or self.tray_profile_menu is None:
             return
-        self.tray_profile_menu.clear()
-        action_group = QtWidgets.QActionGroup(self.tray_profile_menu)
-        action_group.setExclusive(True)
-        for name in self.profile_names():
-            action = self.tray_profile_menu.addAction(name)
-            action.setCheckable(True)
-            action.setChecked(name == self.current_profile)
-            action.setData(name)
-            action_group.addAction(action)
-            color = self.profile_color(name)
-            if color:
-                action.setIcon(make_color_icon(QtGui.QColor(color)))
-        self.tray_profile_menu.addSeparator()
-        create_action = self.tray_profile_menu.addAction("Create New Profile…")
+        self._sync_profile_actions(
+            self.tray_profile_menu,
+            self._tray_actions,
+            self._tray_profile_separator,
+            self._tray_action_group,
+        )
 
     def _sync_profile_ui(self) -> None:
-        self._refresh_profile_menu()
-        if self.settings_dialog:
+        self._profile_menu_timer.start()
+        if self.settings_dialog and self.settings_dialog.isVisible():
             self.settings_dialog.refresh_profiles()
 
     def _on_profile_menu_triggered(self, action: QtGui.QAction) -> None:
@@ -2919,68 +3692,123 @@ class MainWindow(QtWidgets.QMainWindow):
             self.profile_create_edit.setFocus()
             
     def _save_current_profile(self) -> None:
-        self.profiles[self.current_profile] = dict(self.hotkeys)
+        if not self._profiles_loaded or not self._profile_dirty.get(self.current_profile):
+            return
+        self.profiles[self.current_profile] = self.hotkeys
+        self._profile_dirty.clear()
+        self._mark_profiles_dirty()
+
+    def _mark_profiles_dirty(self) -> None:
+        self._profiles_dirty = True
+        self._profile_flush_timer.start()
+
+    def _flush_profiles_now(self) -> None:
+        self._profile_flush_timer.stop()
+        if not self._profiles_loaded:
+            return
+        # The active profile lives in the profiles file, so a switch rides along with the next write.
+        if self.current_profile != self._saved_profile:
+            self._profiles_dirty = True
+        if not self._profiles_dirty:
+            return
         passphrase = self.profile_passphrase if self.profiles_encrypted else None
-        storage.save_profiles(self.current_profile, self.profiles, passphrase=passphrase)
-        
+        snapshot = dict(self.profiles)
+        self._profile_writer.submit(self.current_profile, snapshot, passphrase)
+        self._profiles_dirty = False
+        self._saved_profile = self.current_profile
+
+    def _settle_profile_writes(self) -> None:
+        """Write pending changes and wait, before touching the profiles file directly."""
+        self._flush_profiles_now()
+        self._profile_writer.wait_idle()
+
+    def _finish_profile_writes(self) -> None:
+        self._flush_profiles_now()
+        self._profile_writer.stop()
+
+    def _on_profile_write_succeeded(self) -> None:
+        self._profile_write_warned = False
+
+    def _on_profile_write_failed(self, message: str) -> None:
+        self.logger.error("Failed to save profiles: %s", message)
+        self._mark_profiles_dirty()
+        # Retries keep running on the flush timer; warn once per failure streak.
+        if not self._profile_write_warned:
+            self._profile_write_warned = True
+            QtWidgets.QMessageBox.warning(self, "Profiles", f"Failed to save profiles:\n{message}")
+
     def _normalize_profile_colors(self, colors: object) -> Dict[str, str]:
         if not isinstance(colors, dict):
             return {}
+        if all(
+            isinstance(name, str) and isinstance(value, str) and HEX_COLOR_PATTERN.fullmatch(value)
+            for name, value in colors.items()
+        ):
+            return colors
         normalized: Dict[str, str] = {}
         for name, value in colors.items():
-            if isinstance(name, str) and isinstance(value, str) and value.strip():
-                normalized[name] = value.strip()
+            if not isinstance(name, str) or not isinstance(value, str):
+                continue
+            if HEX_COLOR_PATTERN.fullmatch(value):
+                normalized[name] = value
+                continue
+            value = value.strip()
+            if value and QtGui.QColor(value).isValid():
+                normalized[name] = value
         return normalized
 
-    def _apply_profile_button_color(self) -> None:
-        color_hex = self.profile_color(self.current_profile)
+    def _update_profile_color_derived(self, name: str, color_hex: str | None) -> None:
         if not color_hex:
-            self.profile_button.setStyleSheet("")
+            self._profile_color_derived.pop(name, None)
+            self._profile_qcolor.pop(name, None)
             return
         color = QtGui.QColor(color_hex)
-        text_color = readable_text_color(color)
-        hover_color = color.lighter(115)
-        pressed_color = color.darker(115)
-        self.profile_button.setStyleSheet(
-            (
-                "QPushButton {"
-                f"background-color: {color.name()};"
-                f"color: {text_color.name()};"
-                f"border: 1px solid {pressed_color.name()};"
-                "border-radius: 4px;"
-                "padding: 4px 8px;"
-                "}"
-                "QPushButton:hover {"
-                f"background-color: {hover_color.name()};"
-                f"color: {text_color.name()};"
-                "}"
-                "QPushButton:pressed {"
-                f"background-color: {pressed_color.name()};"
-                f"color: {text_color.name()};"
-                "}"
-            )
+        self._profile_qcolor[name] = color
+        self._profile_color_derived[name] = (
+            color.name(),
+            readable_text_color(color).name(),
+            color.lighter(115).name(),
+            color.darker(115).name(),
         )
 
+    def _apply_profile_button_color(self) -> None:
+        color_hex = self.profile_colors.get(self.current_profile)
+        sheet = self._button_css_cache.get(color_hex, "") if color_hex else ""
+        if color_hex and not sheet:
+            derived = self._profile_color_derived.get(self.current_profile)
+            if derived is not None:
+                base, text, hover, pressed = derived
+                sheet = PROFILE_BUTTON_STYLESHEET.format(base=base, text=text, hover=hover, pressed=pressed)
+                self._button_css_cache[color_hex] = sheet
+        if sheet == self._profile_button_sheet:
+            return
+        self._profile_button_sheet = sheet
+        self.profile_button.setStyleSheet(sheet)
+
     def _normalize_profile_name(self, name: str) -> str:
-        return name.strip()
+        return sys.intern(name.strip())
 
     def create_profile(self, name: str) -> bool:      
+        if not self._require_profiles_loaded("Create Profile"):
+            return False
         name = self._normalize_profile_name(name)
         if not name:
             QtWidgets.QMessageBox.warning(self, "Create Profile", "Profile name cannot be empty.")
             return False
-        if name in self.profiles:
+        if self.has_profile(name):
             QtWidgets.QMessageBox.warning(self, "Create Profile", "That profile already exists.")
             return False
-        self.profiles[name] = {}
-        self.current_profile = name
-        self.hotkeys = {}
-        self.engine.update_hotkeys(self.hotkeys)
-        self.profile_colors.pop(name, None)
-        self._save_current_profile()
-        self.populate_model()
-        self.refresh_status_ui()
-        self._sync_profile_ui()
+        with self._batch_ui():
+            self.profiles[name] = {}
+            self._invalidate_profile_names()
+            self.current_profile = name
+            self.hotkeys = {}
+            self._schedule_engine_update()
+            self.profile_colors.pop(name, None)
+            self._update_profile_color_derived(name, None)
+            self._profile_dirty[self.current_profile] = True
+            self._save_current_profile()
+            self._queue_ui_refresh("model", "status", "profiles")
         return True
     
     def prompt_create_profile(self) -> bool:
@@ -2990,6 +3818,8 @@ class MainWindow(QtWidgets.QMainWindow):
         return self.create_profile(name)
 
     def prompt_rename_profile(self, current_name: str) -> bool:
+        if not self._require_profiles_loaded("Rename Profile"):
+            return False
         new_name, ok = QtWidgets.QInputDialog.getText(
             self,
             "Rename Profile",
@@ -3002,24 +3832,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if not new_name:
             QtWidgets.QMessageBox.warning(self, "Rename Profile", "Profile name cannot be empty.")
             return False
-        if new_name in self.profiles and new_name != current_name:
+        if self.has_profile(new_name) and new_name != current_name:
             QtWidgets.QMessageBox.warning(self, "Rename Profile", "That profile already exists.")
             return False
         if new_name == current_name:
             return False
-        self.profiles[new_name] = self.profiles.pop(current_name)
-        if self.current_profile == current_name:
-            self.current_profile = new_name
-        if current_name in self.profile_colors:
-            self.profile_colors[new_name] = self.profile_colors.pop(current_name)
-            self.config["profile_colors"] = dict(self.profile_colors)
-            storage.save_config(self.config)
-        self._save_current_profile()
-        self._sync_profile_ui()
+        with self._batch_ui():
+            self.profiles[new_name] = self.profiles.pop(current_name)
+            self._invalidate_profile_names()
+            if self.current_profile == current_name:
+                self.current_profile = new_name
+            if current_name in self.profile_colors:
+                self.profile_colors[new_name] = self.profile_colors.pop(current_name)
+                self._profile_color_derived[new_name] = self._profile_color_derived.pop(current_name)
+                self._profile_qcolor[new_name] = self._profile_qcolor.pop(current_name)
+                self._mark_config_dirty()
+            self._profile_dirty[self.current_profile] = True
+            self._save_current_profile()
+            self._queue_ui_refresh("profiles")
         return True
 
     def delete_profile(self, profile_name: str) -> bool:
-        if profile_name not in self.profiles:
+        if not self._require_profiles_loaded("Delete Profile"):
+            return False
+        if not self.has_profile(profile_name):
             return False
         if len(self.profiles) <= 1:
             QtWidgets.QMessageBox.warning(self, "Delete Profile", "You must keep at least one profile.")
@@ -3033,32 +3869,40 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if response != QtWidgets.QMessageBox.Yes:
             return False
-        self.profiles.pop(profile_name, None)
-        self.profile_colors.pop(profile_name, None)
-        if self.current_profile == profile_name:
-            self.current_profile = next(iter(self.profiles))
-            self.hotkeys = dict(self.profiles[self.current_profile])
-            self.engine.update_hotkeys(self.hotkeys)
-            self.populate_model()
-            self.refresh_status_ui()
-        self.config["profile_colors"] = dict(self.profile_colors)
-        storage.save_config(self.config)
-        self._save_current_profile()
-        self._sync_profile_ui()
+        with self._batch_ui():
+            self.profiles.pop(profile_name, None)
+            self._invalidate_profile_names()
+            self.profile_colors.pop(profile_name, None)
+            self._update_profile_color_derived(profile_name, None)
+            if self.current_profile == profile_name:
+                self.current_profile = next(iter(self.profiles))
+                self.hotkeys = self.profiles[self.current_profile]
+                self._schedule_engine_update()
+                self._queue_ui_refresh("model", "status")
+            self._mark_config_dirty()
+            self._profile_dirty[self.current_profile] = True
+            self._save_current_profile()
+            self._queue_ui_refresh("profiles")
         return True
 
     def set_current_profile(self, profile_name: str, *, announce: bool = False) -> bool:
-        if profile_name not in self.profiles:
+        if not self.has_profile(profile_name):
             return False
         if profile_name == self.current_profile:
             return True
-        self._save_current_profile()
-        self.current_profile = profile_name
-        self.hotkeys = dict(self.profiles.get(profile_name, {}))
-        self.engine.update_hotkeys(self.hotkeys)
-        self.populate_model()
-        self.refresh_status_ui()
-        self._sync_profile_ui()
+        with self._batch_ui():
+            self._save_current_profile()
+            self.current_profile = profile_name
+            previous = self.hotkeys
+            self.hotkeys = self.profiles.get(profile_name, {})
+            if self.hotkeys == previous:
+                # Same bindings: the engine, table and trigger index are already correct.
+                if self._trie_source is previous:
+                    self._trie_source = self.hotkeys
+                self._queue_ui_refresh("profiles")
+            else:
+                self._schedule_engine_update()
+                self._queue_ui_refresh("model", "status", "profiles")
         self._sync_quick_add_dialog()
         self._sync_active_add_dialog()
         if announce:
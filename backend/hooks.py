@@ -6,9 +6,15 @@ import platform
 import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Optional
 
 
+@lru_cache(maxsize=512)
+def _parse_hotkey(hotkey: str) -> tuple[str, ...]:
+    return tuple(part.strip().lower() for part in hotkey.split("+"))
+
+
 class HookBackendUnavailable(RuntimeError):
     """Raised when a keyboard hook backend cannot be initialized."""
 
@@ -93,6 +99,39 @@ class PynputBackend(BaseHookBackend):
         self._listener_lock = threading.Lock()
         self._hotkey_lock = threading.Lock()
         self._hotkey_callbacks: dict[str, Callable[[], None]] = {}
+        self._send_plans: dict[str, tuple[tuple[object, ...], object]] = {}
+        key = pynput_keyboard.Key
+        cmd_key = self._command_key()
+        self._key_map: dict[str, object] = {
+            "backspace": key.backspace,
+            "space": key.space,
+            "enter": key.enter,
+            "tab": key.tab,
+            "shift": key.shift,
+            "ctrl": key.ctrl,
+            "alt": key.alt,
+            "cmd": cmd_key,
+            "command": cmd_key,
+            "win": cmd_key,
+            "super": cmd_key,
+        }
+        for number in range(1, 25):
+            function_key = getattr(key, f"f{number}", None)
+            if function_key is not None:
+                self._key_map[f"f{number}"] = function_key
+        self._name_by_key: dict[object, str] = {}
+        for key_obj, name in (
+            (key.space, "space"),
+            (key.enter, "enter"),
+            (key.tab, "tab"),
+            (key.backspace, "backspace"),
+            (key.shift, "shift"),
+            (key.shift_l, "left shift"),
+            (key.shift_r, "right shift"),
+            (key.caps_lock, "caps lock"),
+        ):
+            # Platforms that alias shift_l to shift keep the first name, as the old == chain did.
+            self._name_by_key.setdefault(key_obj, name)
 
     def start(self, handler: Callable[[HookEvent], None]) -> None:
         def on_press(key) -> None:
@@ -116,20 +155,23 @@ class PynputBackend(BaseHookBackend):
             self._listener.join()
 
     def send(self, hotkey: str) -> None:
-        keys = [part.strip().lower() for part in hotkey.split("+")]
-        modifiers = [key for key in keys[:-1]]
-        final = keys[-1]
+        plan = self._send_plans.get(hotkey)
+        if plan is None:
+            *modifiers, final = _parse_hotkey(hotkey)
+            resolved = (self._to_key(mod) for mod in modifiers)
+            plan = self._send_plans[hotkey] = (
+                tuple(key_obj for key_obj in resolved if key_obj is not None),
+                self._to_key(final),
+            )
+        modifier_keys, final_key = plan
         pressed = []
         try:
-            for mod in modifiers:
-                key_obj = self._to_key(mod)
-                if key_obj is not None:
-                    self._controller.press(key_obj)
-                    pressed.append(key_obj)
-            key_obj = self._to_key(final)
-            if key_obj is not None:
+            for key_obj in modifier_keys:
                 self._controller.press(key_obj)
-                self._controller.release(key_obj)
+                pressed.append(key_obj)
+            if final_key is not None:
+                self._controller.press(final_key)
+                self._controller.release(final_key)
         finally:
             for key_obj in reversed(pressed):
                 self._controller.release(key_obj)
@@ -165,53 +207,21 @@ class PynputBackend(BaseHookBackend):
 
     @staticmethod
     def _normalize_hotkey(hotkey: str) -> str:
-        parts = [part.strip().lower() for part in hotkey.split("+")]
-        return "+".join(f"<{part}>" for part in parts)
+        return "+".join(f"<{part}>" for part in _parse_hotkey(hotkey))
 
     def _key_to_name(self, key) -> str | None:
         if isinstance(key, self._keyboard.KeyCode):
             if key.char:
                 return key.char.lower()
             return None
-        if key == self._keyboard.Key.space:
-            return "space"
-        if key == self._keyboard.Key.enter:
-            return "enter"
-        if key == self._keyboard.Key.tab:
-            return "tab"
-        if key == self._keyboard.Key.backspace:
-            return "backspace"
-        if key == self._keyboard.Key.shift:
-            return "shift"
-        if key == self._keyboard.Key.shift_l:
-            return "left shift"
-        if key == self._keyboard.Key.shift_r:
-            return "right shift"
-        if key == self._keyboard.Key.caps_lock:
-            return "caps lock"
-        return None
+        return self._name_by_key.get(key)
 
     def _to_key(self, name: str):
-        cmd_key = self._command_key()
-        mapping = {
-            "backspace": self._keyboard.Key.backspace,
-            "space": self._keyboard.Key.space,
-            "enter": self._keyboard.Key.enter,
-            "tab": self._keyboard.Key.tab,
-            "shift": self._keyboard.Key.shift,
-            "ctrl": self._keyboard.Key.ctrl,
-            "alt": self._keyboard.Key.alt,
-            "cmd": cmd_key,
-            "command": cmd_key,
-            "win": cmd_key,
-            "super": cmd_key,
-        }
-        if name in mapping:
-            return mapping[name]
+        key_obj = self._key_map.get(name)
+        if key_obj is not None:
+            return key_obj
         if len(name) == 1:
             return name
-        if name.startswith("f") and name[1:].isdigit():
-            return getattr(self._keyboard.Key, name)
         return None
 
     def _command_key(self):
@@ -19,6 +19,7 @@ def configure_logging(enabled: bool, log_path: Path) -> logging.Logger:
     # Remove existing handlers to avoid duplicate logs when settings change at runtime.
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
+        handler.close()
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
 
@@ -31,6 +32,7 @@ def configure_logging(enabled: bool, log_path: Path) -> logging.Logger:
         maxBytes=MAX_LOG_BYTES,
         backupCount=LOG_BACKUP_COUNT,
         encoding="utf-8",
+        delay=True,
     )
     file_handler.setLevel(logging.DEBUG)
     formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -323,18 +323,17 @@ def import_hotkeys_from_csv(path: Path) -> Iterable[Tuple[str, str]]:
     path = Path(path)
     with path.open("r", encoding="utf-8") as f:
         reader = csv.reader(f)
-        rows = list(reader)
-    if not rows:
-        return []
-    header = rows[0] if rows else []
-    header_normalized = [value.strip().lower() for value in header]
-    use_dict_reader = False
-    if "trigger" in header_normalized and "output" in header_normalized:
-        use_dict_reader = True
-    elif "hotkey" in header_normalized and "output" in header_normalized:
-        use_dict_reader = True
-    if use_dict_reader:
-        with path.open("r", encoding="utf-8") as f:
+        header = next(reader, None)
+        if header is None:
+            return
+        header_normalized = [value.strip().lower() for value in header]
+        use_dict_reader = False
+        if "trigger" in header_normalized and "output" in header_normalized:
+            use_dict_reader = True
+        elif "hotkey" in header_normalized and "output" in header_normalized:
+            use_dict_reader = True
+        if use_dict_reader:
+            f.seek(0)
             dict_reader = csv.DictReader(f, skipinitialspace=True)
             for row in dict_reader:
                 trigger = (row.get("Trigger") or row.get("trigger") or row.get("Hotkey") or "").strip()
@@ -343,16 +342,16 @@ def import_hotkeys_from_csv(path: Path) -> Iterable[Tuple[str, str]]:
                     continue
                 if trigger and output:
                     yield trigger, output
-        return []
-    for row in rows[1:]:
-        if len(row) < 2:
-            continue
-        trigger = row[0].strip()
-        output = row[1].strip()
-        if _is_sample_csv_row(trigger, output):
-            continue
-        if trigger and output:
-            yield trigger, output
+            return
+        for row in reader:
+            if len(row) < 2:
+                continue
+            trigger = row[0].strip()
+            output = row[1].strip()
+            if _is_sample_csv_row(trigger, output):
+                continue
+            if trigger and output:
+                yield trigger, output
 
 def _is_sample_csv_row(trigger: str, output: str) -> bool:
     if not trigger or not output:
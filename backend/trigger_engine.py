@@ -156,10 +156,14 @@ class TriggerEngine:
             return self._enabled
 
     def update_hotkeys(self, hotkeys: Dict[str, str]) -> None:
+        # Build the new table outside the lock so the keyboard hook only waits for the swap.
+        snapshot = dict(hotkeys)
+        sorted_triggers = sorted(snapshot.items(), key=lambda item: len(item[0]), reverse=True)
+        max_len = max((len(trigger) for trigger in snapshot), default=0)
         with self._lock:
-            self._hotkeys = dict(hotkeys)
-            self._sorted_triggers = sorted(self._hotkeys.items(), key=lambda item: len(item[0]), reverse=True)
-            self._max_len = max((len(trigger) for trigger in self._hotkeys), default=0)
+            self._hotkeys = snapshot
+            self._sorted_triggers = sorted_triggers
+            self._max_len = max_len
             if len(self._buffer) > self._max_len:
                 self._buffer = self._buffer[-self._max_len :]
 
@@ -0,0 +1,101 @@
+"""Prefix trie over hotkey triggers for OpenKeyFlow."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+_END = ""
+
+
+class TriggerTrie:
+    """Character trie answering prefix and extension queries for triggers."""
+
+    def __init__(self, triggers: Iterable[str] = ()) -> None:
+        self._root: Dict[str, dict] = {}
+        self._size = 0
+        for trigger in triggers:
+            self.add(trigger)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, trigger: object) -> bool:
+        if not isinstance(trigger, str):
+            return False
+        node = self._root
+        for char in trigger:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def add(self, trigger: str) -> None:
+        node = self._root
+        for char in trigger:
+            node = node.setdefault(char, {})
+        if _END not in node:
+            node[_END] = {}
+            self._size += 1
+
+    def discard(self, trigger: str) -> None:
+        path = []
+        node = self._root
+        for char in trigger:
+            child = node.get(char)
+            if child is None:
+                return
+            path.append((node, char))
+            node = child
+        if _END not in node:
+            return
+        del node[_END]
+        self._size -= 1
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def prefixes(self, text: str) -> List[str]:
+        """Return stored triggers that ``text`` starts with."""
+        found: List[str] = []
+        node = self._root
+        for index, char in enumerate(text):
+            if _END in node and index:
+                found.append(text[:index])
+            node = node.get(char)
+            if node is None:
+                return found
+        if _END in node:
+            found.append(text)
+        return found
+
+    def keys(self, prefix: str = "", limit: int | None = None) -> List[str]:
+        """Return stored triggers that start with ``prefix``.
+
+        With ``limit``, return at most that many, in sorted order, without
+        walking the rest of the subtree.
+        """
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        found: List[str] = []
+        stack = [(prefix, node)]
+        if limit is None:
+            while stack:
+                key, node = stack.pop()
+                for char, child in node.items():
+                    if char == _END:
+                        found.append(key)
+                    else:
+                        stack.append((key + char, child))
+            return found
+        while stack and len(found) < limit:
+            key, node = stack.pop()
+            if _END in node:
+                found.append(key)
+            # Reverse-sorted push pops the smallest child first: a pre-order walk in key order.
+            for char in sorted(node, reverse=True):
+                if char != _END:
+                    stack.append((key + char, node[char]))
+        return found